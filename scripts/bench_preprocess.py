@@ -0,0 +1,153 @@
+"""
+Benchmark parse-once HTML preprocessing against feeding raw HTML to every extractor.
+
+For each page the "raw" pipeline hands the original HTML to BeautifulSoup,
+newspaper3k, readability and trafilatura; the "cleaned" pipeline runs
+`clean_html` once and hands its output to the same extractors, as
+`extract_from_url` does. Each pipeline runs in its own process so peak RSS is
+comparable. `chars` is the plain text the four extractors return.
+
+By default it runs on the saved real pages in tests/fixtures/pages/. The
+`--synthetic` pages are mostly site chrome (about 94% of their bytes are
+removed by `clean_html`), so their numbers are an upper bound.
+
+    python -m scripts.bench_preprocess                  # fixture corpus of saved pages
+    python -m scripts.bench_preprocess --corpus pages/  # any directory of *.html pages
+    python -m scripts.bench_preprocess --synthetic 40   # generated chrome-heavy pages
+"""
+from __future__ import annotations
+import argparse
+import multiprocessing as mp
+import random
+import resource
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from newspaper import Article
+from readability import Document
+import trafilatura
+
+from supreme_research_mcp.searches.preprocess import clean_html
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "pages"
+
+WORDS = (
+    "research model data analysis climate result method sample network energy "
+    "policy learning system population effect study signal protein market theory"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+
+
+def synthetic_page(seed: int) -> str:
+    """A news/blog-style page: a real article wrapped in typical site chrome."""
+    rng = random.Random(seed)
+    nav = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(rng.randint(80, 200)))
+    scripts = "".join(
+        f"<script>window.__data{i} = {{{','.join(f'k{j}: {j}' for j in range(rng.randint(500, 1500)))}}};</script>"
+        for i in range(rng.randint(3, 8))
+    )
+    styles = "<style>" + "".join(f".c{i} {{ margin: {i}px; color: #{i:06x}; }}" for i in range(rng.randint(300, 900))) + "</style>"
+    svg = '<svg viewBox="0 0 100 100">' + "".join(f'<path d="M{i} {i} L{i+1} {i+2}"/>' for i in range(400)) + "</svg>"
+    article = "".join(f"<p>{' '.join(_sentence(rng) for _ in range(rng.randint(3, 7)))}</p>" for _ in range(rng.randint(8, 30)))
+    sidebar = "".join(f'<div class="teaser"><a href="/a/{i}">{_sentence(rng)}</a></div>' for i in range(rng.randint(20, 60)))
+    footer = "".join(f'<a href="/legal/{i}">Legal link {i}</a>' for i in range(rng.randint(30, 80)))
+    return (
+        f"<!DOCTYPE html><html><head><title>Article {seed}</title>{styles}{scripts}</head><body>"
+        f'<header><div class="logo">{svg}</div><nav><ul>{nav}</ul></nav></header>'
+        f'<div role="dialog" class="cookie-banner">{_sentence(rng)}<button>Accept</button></div>'
+        f"<main><article><header><h1>{_sentence(rng)}</h1></header>{article}</article></main>"
+        f"<aside>{sidebar}</aside><!-- tracking: {'x' * 2000} -->"
+        f"<footer>{footer}<form><input name='email'/><button>Subscribe</button></form></footer>"
+        "</body></html>"
+    )
+
+
+def load_corpus(corpus: Path, synthetic: int) -> List[str]:
+    if synthetic:
+        return [synthetic_page(i) for i in range(synthetic)]
+    return [p.read_text(encoding="utf-8", errors="ignore") for p in sorted(corpus.glob("*.html"))]
+
+
+def _newspaper_text(html: str) -> str:
+    article = Article("https://example.org/")
+    article.download(input_html=html)
+    article.parse()
+    return article.text
+
+
+def _readability_text(html: str) -> str:
+    summary = Document(html).summary()
+    return lxml_html.fromstring(summary).text_content() if summary else ""
+
+
+def _extract_all(html: str) -> int:
+    """Text characters returned by the four extractors `extract_from_url` runs."""
+    chars = len(BeautifulSoup(html, "lxml").get_text(" ", strip=True))
+    chars += len(_newspaper_text(html))
+    chars += len(" ".join(_readability_text(html).split()))
+    chars += len(trafilatura.extract(html) or "")
+    return chars
+
+
+def _run_pipeline(variant: str, corpus: List[str], out: "mp.Queue") -> None:
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    py_peak = 0
+    chars = 0
+    cpu_start = time.process_time()
+    for html in corpus:
+        tracemalloc.reset_peak()
+        if variant == "cleaned":
+            html = clean_html(html)
+        chars += _extract_all(html)
+        py_peak = max(py_peak, tracemalloc.get_traced_memory()[1])
+    cpu = time.process_time() - cpu_start
+    out.put({
+        "cpu_ms_per_page": 1000 * cpu / len(corpus),
+        "py_peak_kib_per_page": py_peak / 1024,
+        "rss_growth_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss,
+        "chars": chars,
+    })
+
+
+def run(variant: str, corpus: List[str]) -> Dict[str, float]:
+    ctx = mp.get_context("fork")
+    out = ctx.Queue()
+    proc = ctx.Process(target=_run_pipeline, args=(variant, corpus, out))
+    proc.start()
+    result = out.get()
+    proc.join()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="Directory of *.html pages")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N", help="Use N generated pages instead")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.synthetic)
+    if not corpus:
+        raise SystemExit("Empty corpus")
+    raw_bytes = sum(len(h) for h in corpus)
+    clean_bytes = sum(len(clean_html(h)) for h in corpus)
+    print(f"Pages: {len(corpus)}, avg HTML {raw_bytes / len(corpus) / 1024:.1f} KiB raw, "
+          f"{clean_bytes / len(corpus) / 1024:.1f} KiB cleaned")
+
+    results = {variant: run(variant, corpus) for variant in ("raw", "cleaned")}
+    print(f"{'':24}{'raw':>12}{'cleaned':>12}{'change':>10}")
+    for key in ("cpu_ms_per_page", "py_peak_kib_per_page", "rss_growth_kib", "chars"):
+        raw, cleaned = results["raw"][key], results["cleaned"][key]
+        change = f"{100 * (cleaned - raw) / raw:+.0f}%" if raw else "n/a"
+        print(f"{key:24}{raw:>12.1f}{cleaned:>12.1f}{change:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,72 @@
 # main.py
 import sys
 import asyncio
+import argparse
 from akinus.web.server.mcp import *
+from supreme_research_mcp.searches.constants import WORKER_CONCURRENCY
+from supreme_research_mcp.searches.embeddings import close_embedding_service
+from supreme_research_mcp.searches.workers import configure_workers, get_coordinator, run_worker
 
 # Import tools so they get registered via decorators
 import supreme_research_mcp.tools.deep_research as mcp_tools
 
+async def serve_coordinator():
+    """Start the job coordinator and wait for its local workers, then serve MCP over stdio on the same loop."""
+    await get_coordinator()
+    await mcp.run_stdio_async()
+
+def run_mode(argv):
+    """
+    Handle the process modes that are not MCP tools:
+
+        supreme_research_mcp coordinator [--listen HOST:PORT] [--workers N]
+            Run the MCP server and dispatch fetch/extract jobs to workers.
+        supreme_research_mcp worker --connect HOST:PORT [--concurrency N]
+            Run a worker process that executes jobs for a coordinator.
+
+    Returns True if argv selected one of these modes.
+    """
+    if not argv or argv[0] not in ("coordinator", "worker"):
+        return False
+
+    parser = argparse.ArgumentParser(prog="supreme_research_mcp")
+    sub = parser.add_subparsers(dest="mode")
+    coord = sub.add_parser("coordinator", help="Run the MCP server with a job queue for workers")
+    coord.add_argument("--listen", default=None, help="HOST:PORT for remote workers (default: local only)")
+    coord.add_argument("--workers", type=int, default=0, help="Worker processes to spawn on this machine")
+    coord.add_argument("--token", default=None, help="Shared worker secret (default: $SUPREME_RESEARCH_WORKER_TOKEN)")
+    worker = sub.add_parser("worker", help="Run a worker for a coordinator")
+    worker.add_argument("--connect", required=True, help="Coordinator HOST:PORT")
+    worker.add_argument("--concurrency", type=int, default=WORKER_CONCURRENCY)
+    worker.add_argument("--no-reconnect", action="store_true", help="Exit when the coordinator goes away")
+    worker.add_argument("--token", default=None, help="Shared worker secret (default: $SUPREME_RESEARCH_WORKER_TOKEN)")
+    args = parser.parse_args(argv)
+
+    if args.mode == "coordinator":
+        try:
+            configure_workers(listen=args.listen, local_workers=args.workers, token=args.token)
+        except ValueError as e:
+            parser.error(str(e))
+        asyncio.run(serve_coordinator())
+    else:
+        try:
+            asyncio.run(run_worker(args.connect, args.concurrency, reconnect=not args.no_reconnect, token=args.token))
+        except ValueError as e:
+            parser.error(str(e))
+    return True
+
+async def run_cli(tool, args):
+    """Run one tool from the command line, then close shared HTTP sessions."""
+    try:
+        return await run_cli_tool(tool, args)
+    finally:
+        await close_embedding_service()
+
 def main():
 
+    if run_mode(sys.argv[1:]):
+        return
+
     tools = discover_mcp_tools(mcp_tools)
 
     print(tools)
@@ -24,7 +83,7 @@ def main():
             sys.exit(1)
 
         # Run the selected tool asynchronously
-        asyncio.run(run_cli_tool(tools[args.command], args))
+        asyncio.run(run_cli(tools[args.command], args))
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,19 @@
 # Auto-generated __init__.py
 
 from . import constants
+from . import embeddings
+from .embeddings import close_embedding_service
+from .embeddings import get_embedding_service
+from . import negative_cache
+from .negative_cache import get_negative_cache
+from . import preprocess
+from .preprocess import clean_html
+from . import profiling
+from .profiling import RequestProfile
+from . import ranking
+from .ranking import rank_results
+from . import records
+from .records import SearchResult
 from . import run_arxiv
 from .run_arxiv import research_arxiv
 from . import run_brave
@@ -13,29 +26,52 @@ from . import run_ddg
 from .run_ddg import research_duckduckgo
 from . import run_openalex
 from .run_openalex import research_openalex
+from . import scheduler
+from .scheduler import get_scheduler
 from . import utils
 from .utils import expand_query_ollama
 from .utils import fetch_text_for_query
 from .utils import print_results
 from .utils import refine_results
+from . import workers
+from .workers import configure_workers
+from .workers import run_worker
 
 __all__ = [
     "constants",
+    "embeddings",
+    "negative_cache",
+    "preprocess",
+    "profiling",
+    "ranking",
+    "records",
     "run_arxiv",
     "run_brave",
     "run_core",
     "run_crossref",
     "run_ddg",
     "run_openalex",
+    "scheduler",
     "utils",
+    "workers",
+    "clean_html",
+    "close_embedding_service",
+    "configure_workers",
     "expand_query_ollama",
     "fetch_text_for_query",
+    "get_embedding_service",
+    "get_negative_cache",
+    "get_scheduler",
     "print_results",
+    "rank_results",
     "refine_results",
+    "RequestProfile",
+    "SearchResult",
     "research_arxiv",
     "research_brave",
     "research_core",
     "research_crossref",
     "research_duckduckgo",
     "research_openalex",
+    "run_worker",
 ]
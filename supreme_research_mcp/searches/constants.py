@@ -12,4 +12,94 @@ BRAVE_RETRY_DELAY = 2
 OPENALEX_MAX_RETRIES = 3
 OPENALEX_RETRY_DELAY = 3
 
-SEARCH_TIMEOUT = 30
\ No newline at end of file
+SEARCH_TIMEOUT = 30
+
+# Keep the full search API response on each SearchResult (debugging only, costs memory)
+KEEP_RAW_RESULTS = False
+
+# Pre-fetch ranking / fetch budget
+FETCH_BUDGET = 15          # number of successfully extracted pages to aim for
+FETCH_TIMEOUT = 15
+
+SOURCE_PRIORS = {
+    "arXiv": 0.9,
+    "Core": 0.8,
+    "OpenAlex": 0.7,
+    "CrossRef": 0.6,
+    "Brave": 0.6,
+    "DuckDuckGo": 0.5,
+}
+DEFAULT_SOURCE_PRIOR = 0.5
+
+RANK_WEIGHT_TITLE = 0.4
+RANK_WEIGHT_SNIPPET = 0.3
+RANK_WEIGHT_PRIOR = 0.2
+RANK_WEIGHT_DUPLICATES = 0.1
+
+
+# Server-wide scheduler (shared by all concurrent requests)
+FETCH_CONCURRENCY = 20
+EXTRACT_CONCURRENCY = 8
+
+SCHEDULER_LIMITS = {
+    "search:Brave": MAX_CONCURRENT_BRAVE,
+    "search:DuckDuckGo": MAX_CONCURRENT_DDG,
+    "search:OpenAlex": MAX_CONCURRENT_OPENALEX,
+    "search:arXiv": MAX_CONCURRENT_ARXIV,
+    "search:Core": MAX_CONCURRENT_CORE,
+    "search:CrossRef": MAX_CONCURRENT_CROSSREF,
+    "fetch": FETCH_CONCURRENCY,
+    "extract": EXTRACT_CONCURRENCY,
+}
+
+MAX_ACTIVE_REQUESTS = 4    # requests running at once
+MAX_QUEUED_REQUESTS = 16   # requests waiting for admission before new ones are shed
+
+
+# Coordinator / worker mode
+WORKER_CONCURRENCY = 8        # jobs each worker process runs at once
+WORKER_LEASE_TIMEOUT = 45     # seconds before a job is handed to another worker
+WORKER_MAX_RETRIES = 2
+WORKER_STALL_TIMEOUT = 90     # seconds a worker may stay silent after a lease expires before it is dropped
+WORKER_JOB_DEADLINE = 180     # seconds a submitted job may take end to end, queueing included
+WORKER_RECONNECT_DELAY = 2
+WORKER_CONNECT_TIMEOUT = 30   # seconds the coordinator waits at startup for its local workers
+WORKER_MAX_FRAME = 16 * 1024 * 1024   # bytes; larger frames close the connection
+WORKER_TOKEN_ENV = "SUPREME_RESEARCH_WORKER_TOKEN"
+
+
+# On-demand request profiling
+PROFILE_INTERVAL = 0.02           # seconds between stack samples
+PROFILE_LOOP_LAG_INTERVAL = 0.05  # seconds between event loop lag probes
+PROFILE_TOP_FUNCTIONS = 15
+
+
+# Negative cache for failing URLs / domains (TTLs in seconds, doubled per consecutive failure)
+NEGATIVE_CACHE_TTLS = {
+    "blocked": 600,
+    "paywall": 3600,
+    "not_found": 3600,
+    "server_error": 120,
+    "timeout": 300,
+    "empty": 1800,
+    "error": 300,
+}
+NEGATIVE_CACHE_MAX_TTL = 24 * 3600
+NEGATIVE_CACHE_MAX_URLS = 10000
+NEGATIVE_CACHE_MAX_DOMAINS = 2000
+NEGATIVE_CACHE_DOMAIN_THRESHOLD = 3   # consecutive failures before a whole domain is skipped
+# Failures that say something about one URL, not about its site
+NEGATIVE_CACHE_URL_ONLY_TYPES = ("not_found", "empty")
+# Resolvers/shorteners whose failures belong to the target site, not to them
+NEGATIVE_CACHE_REDIRECTORS = (
+    "doi.org", "dx.doi.org", "hdl.handle.net", "purl.org", "n2t.net",
+    "identifiers.org", "bit.ly", "t.co", "tinyurl.com", "lnkd.in",
+)
+
+
+# Batched Ollama embeddings
+EMBED_MODEL = "nomic-embed-text"
+EMBED_BATCH_SIZE = 64         # texts per /api/embed request
+EMBED_BATCH_WAIT = 0.01       # seconds to wait for more texts before sending a partial batch
+EMBED_MAX_IN_FLIGHT = 4       # concurrent requests to the Ollama server
+EMBED_REQUEST_TIMEOUT = 120
@@ -0,0 +1,221 @@
+from __future__ import annotations
+import asyncio
+import os
+import time
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+import aiohttp
+import numpy as np
+
+from akinus.ai.ollama import chunk_text
+from akinus.utils.logger import log
+
+from supreme_research_mcp.searches.constants import (
+    EMBED_MODEL,
+    EMBED_BATCH_SIZE,
+    EMBED_BATCH_WAIT,
+    EMBED_MAX_IN_FLIGHT,
+    EMBED_REQUEST_TIMEOUT,
+)
+
+
+class _Pending:
+    __slots__ = ("text", "future", "enqueued")
+
+    def __init__(self, text: str, future: asyncio.Future):
+        self.text = text
+        self.future = future
+        self.enqueued = time.perf_counter()
+
+
+class _Metrics:
+    def __init__(self):
+        self.requests = 0
+        self.batches = 0
+        self.texts = 0
+        self.max_batch = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.latency_total = 0.0
+        self.errors = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": round(self.texts / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch,
+            "avg_queue_wait_ms": round(1000 * self.queue_wait_total / self.texts, 2) if self.texts else 0.0,
+            "max_queue_wait_ms": round(1000 * self.queue_wait_max, 2),
+            "avg_batch_latency_ms": round(1000 * self.latency_total / self.batches, 2) if self.batches else 0.0,
+            "errors": self.errors,
+        }
+
+
+class EmbeddingService:
+    """
+    Coalesces embedding requests from every in-flight call into batched
+    requests to Ollama's /api/embed endpoint.
+
+    A batch is sent once EMBED_BATCH_SIZE texts are waiting for the same model
+    or EMBED_BATCH_WAIT seconds after the first one arrived, whichever comes
+    first. Identical texts in a batch are embedded once. Batches share one
+    pooled HTTP session and at most EMBED_MAX_IN_FLIGHT are sent to Ollama at
+    a time.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        max_batch: int = EMBED_BATCH_SIZE,
+        max_wait: float = EMBED_BATCH_WAIT,
+        max_in_flight: int = EMBED_MAX_IN_FLIGHT,
+    ):
+        host = host or os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+        if not host.startswith("http"):
+            host = f"http://{host}"
+        self.url = host.rstrip("/") + "/api/embed"
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait = max_wait
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._pending: Dict[str, List[_Pending]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.metrics = _Metrics()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=EMBED_MAX_IN_FLIGHT, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=EMBED_REQUEST_TIMEOUT),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def embed(self, text: str, model: str = EMBED_MODEL) -> List[float]:
+        """Embed a single text; concurrent calls are batched together."""
+        loop = asyncio.get_running_loop()
+        item = _Pending(text, loop.create_future())
+        self.metrics.requests += 1
+
+        queue = self._pending.setdefault(model, [])
+        queue.append(item)
+        if len(queue) >= self.max_batch:
+            self._flush(model)
+        elif model not in self._timers:
+            self._timers[model] = loop.call_later(self.max_wait, self._flush, model)
+        return await item.future
+
+    async def embed_many(self, texts: List[str], model: str = EMBED_MODEL) -> List[List[float]]:
+        return list(await asyncio.gather(*(self.embed(t, model) for t in texts)))
+
+    def _flush(self, model: str) -> None:
+        timer = self._timers.pop(model, None)
+        if timer is not None:
+            timer.cancel()
+        queue = self._pending.pop(model, [])
+        while queue:
+            batch, queue = queue[:self.max_batch], queue[self.max_batch:]
+            task = asyncio.ensure_future(self._send(model, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, model: str, batch: List[_Pending]) -> None:
+        unique: Dict[str, int] = {}
+        for item in batch:
+            unique.setdefault(item.text, len(unique))
+
+        async with self._in_flight:
+            sent = time.perf_counter()
+            for item in batch:
+                wait = sent - item.enqueued
+                self.metrics.queue_wait_total += wait
+                self.metrics.queue_wait_max = max(self.metrics.queue_wait_max, wait)
+            try:
+                async with self._get_session().post(self.url, json={"model": model, "input": list(unique)}) as resp:
+                    if resp.status != 200:
+                        raise RuntimeError(f"Ollama embed failed: status {resp.status}: {await resp.text()}")
+                    data = await resp.json()
+                embeddings = data["embeddings"]
+                if len(embeddings) != len(unique):
+                    raise RuntimeError(f"Ollama returned {len(embeddings)} embeddings for {len(unique)} inputs")
+            except Exception as e:
+                self.metrics.errors += 1
+                await log("ERROR", "embeddings", f"Batch of {len(batch)} failed: {e}")
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                return
+            finally:
+                self.metrics.batches += 1
+                self.metrics.texts += len(batch)
+                self.metrics.max_batch = max(self.metrics.max_batch, len(batch))
+                self.metrics.latency_total += time.perf_counter() - sent
+
+        for item in batch:
+            if not item.future.done():
+                item.future.set_result(embeddings[unique[item.text]])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+            "queued": sum(len(q) for q in self._pending.values()),
+            **self.metrics.snapshot(),
+        }
+
+
+_service: Optional[EmbeddingService] = None
+_service_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Return the embedding service for the running event loop, creating it on first use."""
+    global _service, _service_loop
+    loop = asyncio.get_running_loop()
+    if _service is None or _service_loop is not loop:
+        _service = EmbeddingService()
+        _service_loop = loop
+    return _service
+
+
+async def close_embedding_service() -> None:
+    """Close the pooled HTTP session of the current service, if one was created."""
+    global _service, _service_loop
+    if _service is not None and _service_loop is asyncio.get_running_loop():
+        await _service.close()
+    _service = None
+    _service_loop = None
+
+
+async def score_chunks(
+    query: str,
+    text: str,
+    chunk_size: int,
+    overlap: int,
+    model: str = EMBED_MODEL,
+) -> List[Tuple[float, str]]:
+    """
+    Split `text` into chunks and score each by cosine similarity to `query`,
+    embedding the query and all chunks through the batching service.
+
+    Returns:
+        List[Tuple[float, str]]: (score, chunk) pairs in document order.
+    """
+    chunks = [c for c in chunk_text(text, chunk_size=chunk_size, overlap=overlap) if c and c.strip()]
+    if not chunks:
+        return []
+    service = get_embedding_service()
+    vectors = await service.embed_many([query] + chunks, model=model)
+
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1)
+    norms[norms == 0] = 1.0
+    matrix /= norms[:, None]
+    scores = matrix[1:] @ matrix[0]
+    return [(float(score), chunk.strip()) for score, chunk in zip(scores, chunks)]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import asyncio
 import re
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
 from urllib.parse import urlparse
 
 import aiohttp
@@ -9,16 +10,85 @@ from akinus.utils.exceptions import ScrapeError
 
 # Import all your extractors
 from akinus.web.scrape.extract.beautiful_soup import beautiful_soup_extract
-from akinus.web.scrape.extract.newspaper3k import newspaper3k_extract
 from akinus.web.scrape.extract.readability import readability_extract
 from akinus.web.scrape.extract.trafilatura import trafilatura_extract
 from akinus.web.scrape.extract.pdf import pdf_extract
 
+from supreme_research_mcp.searches.constants import FETCH_TIMEOUT
+from supreme_research_mcp.searches.preprocess import clean_html
+from supreme_research_mcp.searches.scheduler import SchedulerTicket, slot
 
-async def extract_from_url(url: str) -> str:
+T = TypeVar("T")
+
+
+def _newspaper_from_html(url: str, html: str) -> str:
+    """newspaper3k on already-fetched HTML instead of letting it download the page again."""
+    from newspaper import Article
+
+    article = Article(url)
+    article.download(input_html=html)
+    article.parse()
+    return article.text
+
+
+async def _in_extract_slot(ticket: Optional[SchedulerTicket], work: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run `work()` while holding an "extract" slot.
+
+    Extractor threads cannot be interrupted. If the caller is cancelled after
+    the work has started, the slot stays taken until the threads are done, so
+    CPU-bound extraction never exceeds EXTRACT_CONCURRENCY.
+    """
+    started = asyncio.Event()
+
+    async def run() -> T:
+        async with slot(ticket, "extract"):
+            started.set()
+            return await work()
+
+    task = asyncio.ensure_future(run())
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        if not started.is_set():
+            # Still queued for the slot: nothing is running yet
+            task.cancel()
+        raise
+
+
+async def _run_html_extractors(url: str, html: str) -> List[Any]:
+    """Clean the page once, then run every HTML extractor on it in threads."""
+    html = await asyncio.to_thread(clean_html, html)
+    tasks = [
+        asyncio.to_thread(beautiful_soup_extract, type("Doc", (), {"html": html})()),
+        asyncio.to_thread(_newspaper_from_html, url, html),
+        asyncio.to_thread(readability_extract, type("Doc", (), {"html": html, "url": url})()),
+        asyncio.to_thread(trafilatura_extract, type("Doc", (), {"html": html, "url": url})()),
+    ]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _fetch_html(url: str) -> str:
+    """Download a page; FETCH_TIMEOUT covers the network request only."""
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT)) as session:
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                raise ScrapeError(f"Failed to fetch HTML: status {resp.status}")
+            return await resp.text()
+
+
+async def extract_from_url(url: str, ticket: Optional[SchedulerTicket] = None) -> str:
     """
     Unified extractor for PDFs and HTML.
     Fully async: uses aiohttp for fetch and threads for blocking parsers.
+    HTML is parsed and stripped of boilerplate once, then every extractor gets
+    the cleaned markup. When a scheduler ticket is given, parsing holds a
+    shared "extract" slot.
+
+    FETCH_TIMEOUT applies to the download only, never to time spent waiting
+    for the "extract" slot or in the HTML extractors, so local load cannot
+    make a healthy page look like a timing-out site. PDFs are downloaded and
+    parsed in one call; their clock starts once the slot is held.
     """
     text_parts = []
 
@@ -26,29 +96,19 @@ async def extract_from_url(url: str) -> str:
     try:
         if is_pdf:
             # Run all PDF extractors in parallel
-            pdf_tasks = [
-                asyncio.create_task(pdf_extract(url))
-            ]
-            pdf_texts = await asyncio.gather(*pdf_tasks)
+            pdf_texts = await _in_extract_slot(
+                ticket,
+                lambda: asyncio.wait_for(asyncio.gather(pdf_extract(url)), timeout=FETCH_TIMEOUT),
+            )
             for t in pdf_texts:
                 if t:
                     text_parts.append(t)
         else:
             # Fetch HTML asynchronously
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=15) as resp:
-                    if resp.status != 200:
-                        raise ScrapeError(f"Failed to fetch HTML: status {resp.status}")
-                    html = await resp.text()
+            html = await _fetch_html(url)
 
             # Run all HTML extractors in parallel using threads for blocking calls
-            tasks = [
-                asyncio.to_thread(beautiful_soup_extract, type("Doc", (), {"html": html})()),
-                asyncio.to_thread(newspaper3k_extract, url),
-                asyncio.to_thread(readability_extract, type("Doc", (), {"html": html, "url": url})()),
-                asyncio.to_thread(trafilatura_extract, type("Doc", (), {"html": html, "url": url})()),
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await _in_extract_slot(ticket, lambda: _run_html_extractors(url, html))
             for r in results:
                 if isinstance(r, Exception):
                     continue
@@ -63,4 +123,5 @@ async def extract_from_url(url: str) -> str:
         return combined_text
 
     except Exception as e:
-        raise ScrapeError(f"Extraction failed for URL {url}: {e}") from e
+        # Some errors (e.g. TimeoutError) stringify to "", keep their type visible
+        raise ScrapeError(f"Extraction failed for URL {url}: {str(e) or type(e).__name__}") from e
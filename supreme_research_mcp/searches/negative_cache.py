@@ -0,0 +1,197 @@
+from __future__ import annotations
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+from supreme_research_mcp.searches.constants import (
+    NEGATIVE_CACHE_TTLS,
+    NEGATIVE_CACHE_MAX_TTL,
+    NEGATIVE_CACHE_MAX_URLS,
+    NEGATIVE_CACHE_MAX_DOMAINS,
+    NEGATIVE_CACHE_DOMAIN_THRESHOLD,
+    NEGATIVE_CACHE_REDIRECTORS,
+    NEGATIVE_CACHE_URL_ONLY_TYPES,
+)
+
+_STATUS_RE = re.compile(r"status (\d{3})")
+
+
+def classify_failure(error: Optional[str]) -> str:
+    """
+    Map an extraction error message to a failure type:
+    "blocked" (401/403/429), "paywall" (402), "not_found" (404/410),
+    "server_error" (5xx), "timeout", "empty" (nothing or too little text) or "error".
+    """
+    if not error:
+        return "empty"
+    match = _STATUS_RE.search(error)
+    if match:
+        status = int(match.group(1))
+        if status in (401, 403, 429):
+            return "blocked"
+        if status == 402:
+            return "paywall"
+        if status in (404, 410):
+            return "not_found"
+        if status >= 500:
+            return "server_error"
+        return "error"
+    lowered = error.lower()
+    if "timeout" in lowered or "timed out" in lowered:
+        return "timeout"
+    if "no content" in lowered:
+        return "empty"
+    return "error"
+
+
+def _domain(url: str) -> str:
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class _Entry:
+    __slots__ = ("failures", "consecutive", "last_type", "blocked_until")
+
+    def __init__(self):
+        self.failures = 0
+        self.consecutive = 0
+        self.last_type: Optional[str] = None
+        self.blocked_until = 0.0
+
+    def fail(self, failure_type: str, now: float, grace: int = 0) -> None:
+        self.failures += 1
+        self.consecutive += 1
+        self.last_type = failure_type
+        # Escalate: every consecutive failure beyond the first `grace + 1`
+        # doubles the backoff
+        ttl = NEGATIVE_CACHE_TTLS.get(failure_type, NEGATIVE_CACHE_TTLS["error"])
+        doublings = max(0, self.consecutive - 1 - grace)
+        self.blocked_until = now + min(NEGATIVE_CACHE_MAX_TTL, ttl * 2 ** doublings)
+
+
+class _DomainStats(_Entry):
+    __slots__ = ("successes", "by_type", "skipped")
+
+    def __init__(self):
+        super().__init__()
+        self.successes = 0
+        self.by_type: Counter = Counter()
+        self.skipped = 0
+
+
+class NegativeCache:
+    """
+    Remembers URLs and domains that recently failed to fetch or extract.
+
+    Each failure puts the URL on a backoff whose TTL depends on the failure
+    type and doubles with every consecutive failure (capped at
+    NEGATIVE_CACHE_MAX_TTL). A domain is backed off as a whole once
+    NEGATIVE_CACHE_DOMAIN_THRESHOLD of its fetches in a row have failed; its
+    backoff starts at the base TTL at that point and doubles from there.
+    Failures in NEGATIVE_CACHE_URL_ONLY_TYPES (dead links, pages without
+    text) back off the URL but do not count towards the domain's streak. A
+    success clears the URL and resets the domain's streak.
+
+    Redirectors such as doi.org are only tracked per URL: their failures
+    belong to whichever publisher they resolve to. Both the URL and domain
+    tables are bounded and evict the least recently touched entry.
+    """
+
+    def __init__(self, max_urls: int = NEGATIVE_CACHE_MAX_URLS, max_domains: int = NEGATIVE_CACHE_MAX_DOMAINS):
+        self.max_urls = max_urls
+        self.max_domains = max_domains
+        self._urls: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._domains: "OrderedDict[str, _DomainStats]" = OrderedDict()
+
+    def _domain_stats(self, url: str) -> Optional[_DomainStats]:
+        domain = _domain(url)
+        if not domain or domain in NEGATIVE_CACHE_REDIRECTORS:
+            return None
+        stats = self._domains.pop(domain, None) or _DomainStats()
+        self._domains[domain] = stats
+        while len(self._domains) > self.max_domains:
+            self._domains.popitem(last=False)
+        return stats
+
+    def check(self, url: str) -> Optional[str]:
+        """Return why `url` should be skipped right now, or None if it may be fetched."""
+        now = time.monotonic()
+        domain = _domain(url)
+        stats = self._domains.get(domain)
+
+        entry = self._urls.get(url)
+        if entry is not None and entry.blocked_until > now:
+            reason = f"URL backed off after {entry.consecutive} {entry.last_type} failure(s)"
+            until = entry.blocked_until
+        elif (
+            stats is not None
+            and stats.consecutive >= NEGATIVE_CACHE_DOMAIN_THRESHOLD
+            and stats.blocked_until > now
+        ):
+            reason = f"Domain {domain} backed off after {stats.consecutive} failures ({stats.last_type})"
+            until = stats.blocked_until
+        else:
+            return None
+
+        if stats is not None:
+            stats.skipped += 1
+        return f"{reason}, retry in {int(until - now)}s"
+
+    def record_failure(self, url: str, failure_type: str) -> None:
+        now = time.monotonic()
+        entry = self._urls.pop(url, None) or _Entry()
+        entry.fail(failure_type, now)
+        self._urls[url] = entry
+        while len(self._urls) > self.max_urls:
+            self._urls.popitem(last=False)
+
+        stats = self._domain_stats(url)
+        if stats is None:
+            return
+        stats.by_type[failure_type] += 1
+        if failure_type in NEGATIVE_CACHE_URL_ONLY_TYPES:
+            stats.failures += 1
+        else:
+            stats.fail(failure_type, now, grace=NEGATIVE_CACHE_DOMAIN_THRESHOLD - 1)
+
+    def record_success(self, url: str) -> None:
+        self._urls.pop(url, None)
+        stats = self._domain_stats(url)
+        if stats is not None:
+            stats.successes += 1
+            stats.consecutive = 0
+            stats.blocked_until = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "urls_backed_off": sum(1 for e in self._urls.values() if e.blocked_until > now),
+            "domains": {
+                domain: {
+                    "successes": s.successes,
+                    "failures": s.failures,
+                    "failure_types": dict(s.by_type),
+                    "consecutive_failures": s.consecutive,
+                    "skipped": s.skipped,
+                    "backed_off_for_s": (
+                        int(s.blocked_until - now)
+                        if s.consecutive >= NEGATIVE_CACHE_DOMAIN_THRESHOLD and s.blocked_until > now
+                        else 0
+                    ),
+                }
+                for domain, s in sorted(self._domains.items(), key=lambda kv: kv[1].failures, reverse=True)
+            },
+        }
+
+
+_negative_cache: Optional[NegativeCache] = None
+
+
+def get_negative_cache() -> NegativeCache:
+    """Return the process-wide negative cache, creating it on first use."""
+    global _negative_cache
+    if _negative_cache is None:
+        _negative_cache = NegativeCache()
+    return _negative_cache
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import Union
+
+from lxml import etree
+from lxml import html as lxml_html
+
+# Elements that never carry article text
+BOILERPLATE_TAGS = (
+    "script", "style", "noscript", "template", "iframe", "object", "embed",
+    "svg", "canvas", "nav", "aside", "footer", "button", "select",
+    "input", "textarea",
+)
+
+# A <form> is only dropped below this much text: ASP.NET WebForms and some
+# CMSs wrap the entire page body in one
+FORM_MAX_TEXT = 300
+
+# ARIA landmarks for site chrome
+BOILERPLATE_ROLES = ("navigation", "banner", "contentinfo", "complementary", "search", "dialog")
+
+_BOILERPLATE_XPATH = (
+    "//comment() | //processing-instruction()"
+    " | " + " | ".join(f"//{tag}" for tag in BOILERPLATE_TAGS)
+    + " | " + " | ".join(f"//*[@role='{role}']" for role in BOILERPLATE_ROLES)
+    + " | //*[@hidden] | //*[@aria-hidden='true']"
+    # Page-level <header> is chrome; an article's own <header> holds its title
+    + " | //header[not(ancestor::article) and not(ancestor::main)]"
+    + " | //form[not(.//article) and not(.//main)"
+    f" and string-length(normalize-space(.)) < {FORM_MAX_TEXT}]"
+)
+
+
+def clean_html(html: Union[str, bytes]) -> str:
+    """
+    Parse a page once with lxml and strip scripts, styles, navigation and other
+    obvious boilerplate.
+
+    The cleaned markup is what every HTML extractor receives, so each of them
+    parses a much smaller document. Text that follows a removed element (its
+    tail) is kept. If the page cannot be parsed it is returned unchanged.
+
+    Args:
+        html (str | bytes): Raw page HTML.
+
+    Returns:
+        str: Cleaned HTML.
+    """
+    try:
+        try:
+            tree = lxml_html.document_fromstring(html)
+        except ValueError:
+            # str input with an XML encoding declaration
+            tree = lxml_html.document_fromstring(html.encode("utf-8"))
+    except (etree.ParserError, ValueError):
+        return html.decode("utf-8", errors="ignore") if isinstance(html, bytes) else html
+
+    for el in tree.xpath(_BOILERPLATE_XPATH):
+        if el.getparent() is not None:
+            el.drop_tree()
+
+    return lxml_html.tostring(tree, encoding="unicode")
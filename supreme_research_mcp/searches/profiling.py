@@ -0,0 +1,240 @@
+from __future__ import annotations
+import asyncio
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType
+from typing import Dict, Any, List, Optional, Tuple
+
+from akinus.utils.app_details import PROJECT_ROOT
+from akinus.utils.logger import log
+
+from supreme_research_mcp.searches.constants import (
+    PROFILE_INTERVAL,
+    PROFILE_LOOP_LAG_INTERVAL,
+    PROFILE_TOP_FUNCTIONS,
+)
+
+# Leaf frames of threads that are parked waiting for work, not burning CPU
+_IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+
+class SamplingProfiler:
+    """
+    Wall-clock stack sampler for every Python thread in the process.
+
+    A background thread snapshots `sys._current_frames()` every `interval`
+    seconds, which covers the event loop thread and the executor threads used
+    by `asyncio.to_thread` alike. Samples of idle threads are dropped. Stacks
+    are aggregated in folded form ("thread;outer;...;leaf count"), which
+    flamegraph.pl, speedscope and inferno read directly.
+
+    Being wall-clock, a thread blocked inside C code (DNS lookups, socket
+    reads, PDF downloads) is sampled just like one running Python code.
+
+    Sampling holds the GIL, so it only records code objects; labels are
+    formatted once per code object when results are read.
+    """
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self._raw: Counter = Counter()
+        self._labels: Dict[CodeType, str] = {}
+        self._idle: Dict[CodeType, bool] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _is_idle(self, code: CodeType) -> bool:
+        idle = self._idle.get(code)
+        if idle is None:
+            idle = self._idle[code] = (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES
+        return idle
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def _sample(self) -> None:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own or self._is_idle(frame.f_code):
+                continue
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            self._raw[(names.get(ident, f"thread-{ident}"), tuple(codes))] += 1
+            self.samples += 1
+
+    @property
+    def stacks(self) -> Counter:
+        """Folded stacks ("thread;outer;...;leaf") and their sample counts."""
+        folded: Counter = Counter()
+        for (thread, codes), count in self._raw.items():
+            folded[";".join([thread, *(self._label(c) for c in reversed(codes))])] += count
+        return folded
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="deep-research-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def write_folded(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def top_functions(self, n: int = PROFILE_TOP_FUNCTIONS) -> List[Dict[str, Any]]:
+        """
+        Functions most often on top of a sampled stack (self samples), with
+        their inclusive (total) samples. Wall-clock: includes time blocked in I/O.
+        """
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")[1:]  # drop thread name
+            if not frames:
+                continue
+            self_counts[frames[-1]] += count
+            for label in set(frames):
+                total_counts[label] += count
+        total = self.samples or 1
+        return [
+            {
+                "function": label,
+                "self_samples": samples,
+                "total_samples": total_counts[label],
+                "self_pct": round(100.0 * samples / total, 1),
+            }
+            for label, samples in self_counts.most_common(n)
+        ]
+
+
+class _LoopLagMonitor:
+    """Measures how late the event loop wakes up a sleeping task (time tasks spend waiting to run)."""
+
+    def __init__(self, interval: float = PROFILE_LOOP_LAG_INTERVAL):
+        self.interval = interval
+        self.lags: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - start - self.interval))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def summary(self) -> Dict[str, float]:
+        if not self.lags:
+            return {"samples": 0, "mean_ms": 0.0, "max_ms": 0.0}
+        return {
+            "samples": len(self.lags),
+            "mean_ms": round(1000 * sum(self.lags) / len(self.lags), 2),
+            "max_ms": round(1000 * max(self.lags), 2),
+        }
+
+
+class RequestProfile:
+    """
+    Profile of one `run_deep_research` call: CPU stack samples, event loop lag
+    and the time the request spent queued for shared scheduler resources.
+
+    Samples cover the whole process, so requests running concurrently show up
+    as well. In coordinator mode only the coordinator process is sampled.
+    """
+
+    def __init__(self, query: str, request_id: Optional[int] = None):
+        self.query = query
+        self.request_id = request_id
+        self.profiler = SamplingProfiler()
+        self.loop_lag = _LoopLagMonitor()
+        self._started = 0.0
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self.profiler.start()
+        self.loop_lag.start()
+
+    async def stop(self, resource_waits: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, Any]:
+        """Stop sampling, write the folded stacks under data/profiles/ and return a summary."""
+        elapsed = time.perf_counter() - self._started
+        await asyncio.to_thread(self.profiler.stop)
+        await self.loop_lag.stop()
+
+        slug = re.sub(r"[^a-z0-9]+", "-", self.query.lower()).strip("-")[:40] or "query"
+        if self.request_id is not None:
+            # Timestamps have 1 s precision; the request id keeps concurrent profiles apart
+            slug = f"r{self.request_id}_{slug}"
+        path = PROJECT_ROOT / "data" / "profiles" / f"{time.strftime('%Y%m%d-%H%M%S')}_{slug}.folded"
+        # Formatting and writing the stacks stays off the event loop
+        await asyncio.to_thread(self.profiler.write_folded, path)
+        top_functions = await asyncio.to_thread(self.profiler.top_functions)
+        await log("INFO", "profiling", f"Wrote {self.profiler.samples} samples to {path}")
+
+        return {
+            "profile_file": str(path),
+            "request_id": self.request_id,
+            "elapsed_s": round(elapsed, 3),
+            "samples": self.profiler.samples,
+            "interval_ms": self.profiler.interval * 1000,
+            "sampling": (
+                "wall-clock: top_functions counts where threads were, not CPU burned; "
+                "threads blocked in I/O (DNS, downloads) show up as busy"
+            ),
+            "top_functions": top_functions,
+            "event_loop_lag": self.loop_lag.summary(),
+            "resource_waits": resource_waits or {},
+        }
+
+
+_profile_next = 0
+_profile_lock = threading.Lock()
+
+
+def profile_next_requests(count: int) -> int:
+    """Profile the next `count` deep-research requests; returns the number still pending."""
+    global _profile_next
+    with _profile_lock:
+        _profile_next = max(0, int(count))
+        return _profile_next
+
+
+def take_profile_request() -> bool:
+    """Consume one pending profiling slot, if any."""
+    global _profile_next
+    with _profile_lock:
+        if _profile_next <= 0:
+            return False
+        _profile_next -= 1
+        return True
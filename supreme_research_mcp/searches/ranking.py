@@ -0,0 +1,110 @@
+from __future__ import annotations
+import re
+from typing import Dict, Any, List, Iterable, Set, Tuple
+from urllib.parse import urlsplit
+
+from supreme_research_mcp.searches.constants import (
+    SOURCE_PRIORS,
+    DEFAULT_SOURCE_PRIOR,
+    RANK_WEIGHT_TITLE,
+    RANK_WEIGHT_SNIPPET,
+    RANK_WEIGHT_PRIOR,
+    RANK_WEIGHT_DUPLICATES,
+)
+from supreme_research_mcp.searches.records import SearchResult
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Words that carry no signal when comparing a hit against the query
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how",
+    "in", "is", "it", "of", "on", "or", "that", "the", "to", "was", "what",
+    "when", "where", "which", "who", "why", "with",
+}
+
+
+def _tokens(text: Any) -> Set[str]:
+    """Lowercase word set of `text` without stopwords."""
+    if not isinstance(text, str) or not text:
+        return set()
+    return {t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS}
+
+
+def _overlap(query_tokens: Set[str], text: Any) -> float:
+    """Fraction of query tokens present in `text` (0.0 - 1.0)."""
+    if not query_tokens:
+        return 0.0
+    return len(query_tokens & _tokens(text)) / len(query_tokens)
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Key used to detect the same URL returned by several sources/subqueries.
+    Only the scheme and host are case-insensitive; path and query keep their case.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    key = host + parts.path.rstrip("/")
+    if parts.query:
+        key += "?" + parts.query
+    if parts.scheme.lower() not in ("http", "https", ""):
+        key = f"{parts.scheme.lower()}://{key}"
+    return key
+
+
+def _richness(r: SearchResult) -> Tuple[bool, int]:
+    """How much a hit tells the ranker: has a title, then snippet length."""
+    return bool(r.title), len(r.snippet) if isinstance(r.snippet, str) else 0
+
+
+def rank_results(results: Iterable[SearchResult], queries: List[str]) -> List[SearchResult]:
+    """
+    Cheap pre-fetch ranking of raw search hits.
+
+    Hits are merged by URL, keeping the one with the richest title and snippet,
+    then scored by lexical similarity of their title and
+    snippet/abstract to the queries, a per-source prior and the number of times the
+    same URL was returned. Nothing is fetched here; the output order decides which
+    URLs are worth spending the fetch budget on.
+
+    Args:
+        results (Iterable[SearchResult]): Search hits from all sources and subqueries.
+        queries (List[str]): Original query plus its expansions.
+
+    Returns:
+        List[SearchResult]: One hit per URL, best first, with `rank_score` and
+        `duplicates` set. Hits without a URL are dropped.
+    """
+    query_tokens = set()
+    for q in queries:
+        query_tokens |= _tokens(q)
+
+    merged: Dict[str, SearchResult] = {}
+    for r in results:
+        if not r.url:
+            continue
+        key = _normalize_url(r.url)
+        kept = merged.get(key)
+        if kept is None:
+            r.duplicates = 1
+            merged[key] = r
+        elif _richness(r) > _richness(kept):
+            # Rank (and later fetch) the copy with the best title/snippet
+            r.duplicates = kept.duplicates + 1
+            merged[key] = r
+        else:
+            kept.duplicates += 1
+
+    max_dupes = max((r.duplicates for r in merged.values()), default=1)
+
+    for r in merged.values():
+        r.rank_score = (
+            RANK_WEIGHT_TITLE * _overlap(query_tokens, r.title)
+            + RANK_WEIGHT_SNIPPET * _overlap(query_tokens, r.snippet)
+            + RANK_WEIGHT_PRIOR * SOURCE_PRIORS.get(r.source, DEFAULT_SOURCE_PRIOR)
+            + RANK_WEIGHT_DUPLICATES * (r.duplicates / max_dupes)
+        )
+
+    return sorted(merged.values(), key=lambda r: r.rank_score, reverse=True)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+import sys
+from typing import Dict, Any, Optional, Tuple
+
+
+def _intern(value: Any) -> Optional[str]:
+    """Intern short, highly repeated strings (source names, subqueries)."""
+    if not isinstance(value, str):
+        return None
+    return sys.intern(value)
+
+
+class SearchResult:
+    """
+    Compact record for one search hit as it moves through `run_deep_research`.
+
+    Uses __slots__ instead of a per-instance dict, interns `source` and `subquery`
+    (shared by every hit of a search call), and only keeps the full API response
+    in `raw` when asked to. The extracted `text` is dropped with `release_text()`
+    once it has been chunked and embedded; `chars` keeps its length.
+
+    `get()` mirrors dict access so helpers written for plain result dicts
+    (`print_results`, `refine_results`) accept records unchanged.
+    """
+
+    __slots__ = (
+        "title",
+        "url",
+        "source",
+        "subquery",
+        "snippet",
+        "authors",
+        "date",
+        "raw",
+        "text",
+        "chars",
+        "extraction_error",
+        "rank_score",
+        "duplicates",
+    )
+
+    def __init__(
+        self,
+        url: Optional[str],
+        title: Optional[str] = None,
+        source: Optional[str] = None,
+        subquery: Optional[str] = None,
+        snippet: Optional[str] = None,
+        authors: Tuple[str, ...] = (),
+        date: Any = None,
+        raw: Optional[Dict[str, Any]] = None,
+    ):
+        self.url = url
+        self.title = title
+        self.source = _intern(source)
+        self.subquery = _intern(subquery)
+        self.snippet = snippet
+        self.authors = authors
+        self.date = date
+        self.raw = raw
+        self.text: Optional[str] = None
+        self.chars = 0
+        self.extraction_error: Optional[str] = None
+        self.rank_score = 0.0
+        self.duplicates = 1
+
+    @classmethod
+    def from_hit(cls, hit: Dict[str, Any], source: str, subquery: str, keep_raw: bool = False) -> "SearchResult":
+        """Build a record from a raw search API hit, copying only the fields we use."""
+        authors = hit.get("authors") or ()
+        return cls(
+            url=hit.get("url") or hit.get("doi_link"),
+            title=hit.get("title"),
+            source=source,
+            subquery=subquery,
+            snippet=hit.get("snippet") or hit.get("abstract"),
+            authors=tuple(str(a) for a in authors) if isinstance(authors, (list, tuple)) else (),
+            date=hit.get("date") or hit.get("published_date") or hit.get("year"),
+            raw=(hit.get("raw") or hit) if keep_raw else None,
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def set_text(self, text: Optional[str]) -> None:
+        self.text = text or None
+        self.chars = len(text) if text else 0
+
+    def set_error(self, error: str) -> None:
+        self.text = None
+        self.chars = 0
+        self.extraction_error = error
+
+    def release_text(self) -> None:
+        """Drop the extracted text once it is no longer needed; `chars` is kept."""
+        self.text = None
+
+    def __repr__(self) -> str:
+        return f"SearchResult(source={self.source!r}, url={self.url!r}, chars={self.chars})"
@@ -0,0 +1,206 @@
+from __future__ import annotations
+import asyncio
+import contextlib
+import itertools
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Any, AsyncIterator, Deque, Optional
+
+from supreme_research_mcp.searches.constants import (
+    SCHEDULER_LIMITS,
+    MAX_ACTIVE_REQUESTS,
+    MAX_QUEUED_REQUESTS,
+)
+
+# Lower value is served first
+PRIORITIES = {
+    "interactive": 0,
+    "batch": 1,
+}
+
+
+class SchedulerBusyError(RuntimeError):
+    """Raised when a request is shed because the server is saturated."""
+
+
+class _FairResource:
+    """
+    Counting semaphore shared by all requests.
+
+    Waiters are served strictly by priority class, and round-robin between
+    requests within a class, so one request with many queued jobs cannot
+    starve the others.
+    """
+
+    def __init__(self, name: str, capacity: int):
+        self.name = name
+        self.capacity = max(1, int(capacity))
+        self.in_use = 0
+        self._queues: Dict[int, "OrderedDict[int, Deque[asyncio.Future]]"] = {
+            p: OrderedDict() for p in sorted(PRIORITIES.values())
+        }
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(dq) for q in self._queues.values() for dq in q.values())
+
+    async def acquire(self, request_id: int, priority: int) -> None:
+        if self.in_use < self.capacity and not self.waiting:
+            self.in_use += 1
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        self._queues[priority].setdefault(request_id, deque()).append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was handed over just before cancellation; give it back
+                self.release()
+            else:
+                self._discard(request_id, priority, fut)
+            raise
+
+    def release(self) -> None:
+        self.in_use -= 1
+        while self.in_use < self.capacity:
+            fut = self._pop_next()
+            if fut is None:
+                return
+            if fut.done():
+                continue
+            self.in_use += 1
+            fut.set_result(None)
+
+    def _pop_next(self) -> Optional[asyncio.Future]:
+        for priority in sorted(self._queues):
+            queue = self._queues[priority]
+            if not queue:
+                continue
+            request_id, dq = next(iter(queue.items()))
+            fut = dq.popleft()
+            if dq:
+                queue.move_to_end(request_id)
+            else:
+                del queue[request_id]
+            return fut
+        return None
+
+    def _discard(self, request_id: int, priority: int, fut: asyncio.Future) -> None:
+        dq = self._queues[priority].get(request_id)
+        if dq is None:
+            return
+        with contextlib.suppress(ValueError):
+            dq.remove(fut)
+        if not dq:
+            del self._queues[priority][request_id]
+
+    def stats(self) -> Dict[str, int]:
+        return {"capacity": self.capacity, "in_use": self.in_use, "waiting": self.waiting}
+
+
+class SchedulerTicket:
+    """
+    Handle for one admitted request; used to acquire shared resource slots.
+    Keeps the time spent waiting for admission and for each resource.
+    """
+
+    def __init__(self, scheduler: "ResearchScheduler", request_id: int, priority: int, admission_wait: float = 0.0):
+        self.scheduler = scheduler
+        self.request_id = request_id
+        self.priority = priority
+        self.waits: Dict[str, Dict[str, float]] = {}
+        self._record_wait("admission", admission_wait)
+
+    def _record_wait(self, resource: str, seconds: float) -> None:
+        w = self.waits.setdefault(resource, {"count": 0, "total_s": 0.0, "max_s": 0.0})
+        w["count"] += 1
+        w["total_s"] += seconds
+        w["max_s"] = max(w["max_s"], seconds)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, resource: str) -> AsyncIterator[None]:
+        res = self.scheduler.resource(resource)
+        started = time.perf_counter()
+        await res.acquire(self.request_id, self.priority)
+        self._record_wait(resource, time.perf_counter() - started)
+        try:
+            yield
+        finally:
+            res.release()
+
+
+class ResearchScheduler:
+    """
+    Server-wide scheduler for concurrent `run_deep_research` calls.
+
+    Admission control caps the number of requests running at once; further
+    requests queue up to MAX_QUEUED_REQUESTS and are shed beyond that. Each
+    admitted request then competes fairly for the global per-resource limits
+    (search sources, fetch, extraction). Embedding concurrency is capped by
+    the shared EmbeddingService instead.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, int] = SCHEDULER_LIMITS,
+        max_active: int = MAX_ACTIVE_REQUESTS,
+        max_queued: int = MAX_QUEUED_REQUESTS,
+    ):
+        self._resources = {name: _FairResource(name, cap) for name, cap in limits.items()}
+        self._admission = _FairResource("admission", max_active)
+        self.max_queued = max_queued
+        self._ids = itertools.count(1)
+        self.shed = 0
+
+    def resource(self, name: str) -> _FairResource:
+        if name not in self._resources:
+            raise KeyError(f"Unknown scheduler resource: {name}")
+        return self._resources[name]
+
+    @contextlib.asynccontextmanager
+    async def request(self, priority: str = "interactive") -> AsyncIterator[SchedulerTicket]:
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}', expected one of {list(PRIORITIES)}")
+        level = PRIORITIES[priority]
+
+        saturated = self._admission.in_use >= self._admission.capacity
+        if saturated and self._admission.waiting >= self.max_queued:
+            self.shed += 1
+            raise SchedulerBusyError(
+                f"Server saturated: {self._admission.in_use} running, "
+                f"{self._admission.waiting} queued"
+            )
+
+        request_id = next(self._ids)
+        started = time.perf_counter()
+        await self._admission.acquire(request_id, level)
+        try:
+            yield SchedulerTicket(self, request_id, level, time.perf_counter() - started)
+        finally:
+            self._admission.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "admission": self._admission.stats(),
+            "shed": self.shed,
+            "resources": {name: r.stats() for name, r in self._resources.items()},
+        }
+
+
+_scheduler: Optional[ResearchScheduler] = None
+
+
+def get_scheduler() -> ResearchScheduler:
+    """Return the process-wide scheduler, creating it on first use."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = ResearchScheduler()
+    return _scheduler
+
+
+def slot(ticket: Optional[SchedulerTicket], resource: str):
+    """`ticket.slot(resource)`, or a no-op context when called outside the scheduler."""
+    if ticket is None:
+        return contextlib.nullcontext()
+    return ticket.slot(resource)
@@ -1,16 +1,17 @@
 from __future__ import annotations
 from akinus.utils.app_details import PROJECT_ROOT
-from akinus.ai.ollama import get_relevant_text_ollama
 import textwrap
 from typing import List, Dict, Any, Iterable, Optional
 from typing import List
-from akinus.ai.ollama import ollama_query, embed_with_ollama, cosine_similarity, chunk_text
+from akinus.ai.ollama import ollama_query, cosine_similarity
 import json
 import asyncio
 import numpy as np
 from akinus.utils.logger import log
 from akinus.web.scrape.fetch import fetch_url
 from akinus.web.scrape.extract.extract import async_extract_from_fetched
+from supreme_research_mcp.searches.records import SearchResult
+from supreme_research_mcp.searches.embeddings import get_embedding_service, score_chunks
 
 
 async def fetch_text_for_query(query: str, urls: list[str]) -> list[str]:
@@ -45,14 +46,15 @@ def print_results(stitched: list[dict]):
             print(f"[{i}] {title}\n{url}")
 
             # Preview for console
-            if "text" in item and item["text"]:
-                preview = textwrap.shorten(item["text"].replace("\n", " "), width=500)
+            text = item.get("text")
+            if text:
+                preview = textwrap.shorten(text.replace("\n", " "), width=500)
                 print(f"Chars: {item.get('chars')}")
                 print(f"Preview: {preview}")
 
                 # Save full text to file
                 f.write(f"\n\n=== {i}. {title} ===\nURL: {url}\n\n")
-                f.write(item["text"])
+                f.write(text)
                 f.write("\n" + "="*80 + "\n")
             else:
                 print(f"Extraction error: {item.get('extraction_error')}")
@@ -97,14 +99,18 @@ def _make_text_blob(stitched: List[Dict[str, Any]]) -> str:
         parts.append(f"{header}\n\n{body}")
     return "\n\n\n".join(parts)
 
-async def refine_results(stitched: List[Dict], query: str, top_k: int = 5, chunk_size: int = 250, overlap: int = 100, include_scores: bool = False) -> str:
+async def refine_results(stitched: List[Dict | SearchResult], query: str, top_k: int = 5, chunk_size: int = 250, overlap: int = 100, include_scores: bool = False) -> str:
     """
     Refine search results globally based on the query using Ollama embeddings.
     Each document is split into chunks, embedded, and scored. The top-k chunks 
     across all documents are returned to ensure maximum relevance.
+    Chunks of all documents are embedded through the shared batching service,
+    which caps concurrent Ollama requests itself. This stays in the MCP
+    server process in coordinator mode too, so one client sees every request.
+    `SearchResult` records have their text released once it has been embedded.
 
     Args:
-        stitched (List[Dict]): Combined search results, each with a 'text' field.
+        stitched (List[Dict | SearchResult]): Combined search results, each with a 'text' field.
         query (str): The search query.
         top_k (int): Number of top relevant chunks to return globally.
         chunk_size (int): Maximum number of characters per chunk.
@@ -115,35 +121,23 @@ async def refine_results(stitched: List[Dict], query: str, top_k: int = 5, chunk
         str: Concatenated top-k relevant text chunks.
     """
     # Filter out entries without text
-    texts = [r.get("text") for r in stitched if r.get("text")]
-    if not texts:
+    items = [r for r in stitched if r.get("text")]
+    if not items:
         await log("WARNING", "refine_results", "No valid text found in stitched results for embedding.")
         return ""
 
     # Prepare async embedding for each text
-    async def embed_chunks(text: str):
-        return await get_relevant_text_ollama(
-            query=query,
-            text=text,
-            top_k=500,  # get all chunks
-            chunk_size=chunk_size,
-            overlap=overlap,
-            include_scores=True
-        )
-
-    results = await asyncio.gather(*(embed_chunks(text) for text in texts))
+    async def embed_chunks(item):
+        scored = await score_chunks(query, item.get("text"), chunk_size=chunk_size, overlap=overlap)
+        if isinstance(item, SearchResult):
+            item.release_text()
+        return scored
+
+    results = await asyncio.gather(*(embed_chunks(item) for item in items))
+    del items
 
     # Flatten all chunks with their scores
-    all_chunks = []
-    for res in results:
-        for chunk in res.split("\n\n"):
-            if chunk.startswith("[Score:"):
-                score_part, text_part = chunk.split("]", 1)
-                score = float(score_part.replace("[Score:", "").strip())
-                all_chunks.append((score, text_part.strip()))
-            else:
-                # fallback if scores not included
-                all_chunks.append((1.0, chunk.strip()))
+    all_chunks = [(float(score), chunk) for res in results for score, chunk in res]
 
     # Sort globally by score
     top_chunks = sorted(all_chunks, key=lambda x: x[0], reverse=True)[:top_k or len(all_chunks)]
@@ -214,15 +208,9 @@ async def expand_query_ollama(
         ][:5]
         await log("INFO", "expand_query_ollama", f"Using fallback candidates: {candidates}")
 
-    # 2. Compute embeddings asynchronously for query and all candidates
-    async def async_embed(text: str):
-        return await asyncio.to_thread(embed_with_ollama, text, model=embedding_model)
-
-    query_emb_task = asyncio.create_task(async_embed(query))
-    candidate_emb_tasks = [async_embed(c) for c in candidates]
-
-    query_emb = await query_emb_task
-    candidate_embs = await asyncio.gather(*candidate_emb_tasks)
+    # 2. Compute embeddings for query and all candidates (batched together by the service)
+    embedder = get_embedding_service()
+    query_emb, *candidate_embs = await embedder.embed_many([query] + candidates, model=embedding_model)
 
     # 3. Score candidates by cosine similarity
     scored = []
@@ -0,0 +1,473 @@
+from __future__ import annotations
+import asyncio
+import hmac
+import itertools
+import json
+import os
+import secrets
+import socket
+import struct
+import sys
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+from akinus.utils.logger import log
+
+from supreme_research_mcp.searches.constants import (
+    WORKER_CONCURRENCY,
+    WORKER_CONNECT_TIMEOUT,
+    WORKER_JOB_DEADLINE,
+    WORKER_LEASE_TIMEOUT,
+    WORKER_MAX_FRAME,
+    WORKER_MAX_RETRIES,
+    WORKER_RECONNECT_DELAY,
+    WORKER_STALL_TIMEOUT,
+    WORKER_TOKEN_ENV,
+)
+from supreme_research_mcp.searches.extraction import extract_from_url
+from supreme_research_mcp.searches.scheduler import SchedulerTicket
+
+# Wire format: 4-byte big-endian length followed by a UTF-8 JSON object of at
+# most WORKER_MAX_FRAME bytes. Workers must present the shared token in hello.
+#   worker -> coordinator: {"type": "hello", "worker": str, "concurrency": int, "token": str}
+#                          {"type": "result", "job_id": int, "ok": bool, "value": ..., "error": str}
+#   coordinator -> worker: {"type": "job", "job_id": int, "kind": str, "payload": {...}}
+_HEADER = struct.Struct(">I")
+
+
+class WorkerJobError(RuntimeError):
+    """Raised when a job fails on a worker or runs out of retries."""
+
+
+async def _write_message(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+    body = json.dumps(message).encode("utf-8")
+    if len(body) > WORKER_MAX_FRAME:
+        raise ValueError(f"Message of {len(body)} bytes exceeds WORKER_MAX_FRAME ({WORKER_MAX_FRAME})")
+    writer.write(_HEADER.pack(len(body)) + body)
+    await writer.drain()
+
+
+async def _read_message(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    try:
+        header = await reader.readexactly(_HEADER.size)
+        (length,) = _HEADER.unpack(header)
+        if length > WORKER_MAX_FRAME:
+            # Refuse to allocate whatever size the peer claims; drop the connection
+            return None
+        body = await reader.readexactly(length)
+        message = json.loads(body.decode("utf-8"))
+    except (asyncio.IncompleteReadError, ConnectionError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return message if isinstance(message, dict) else None
+
+
+# --- Job handlers (run on workers, or locally when no worker is connected) ---
+# In-process runs get the submitting request's scheduler ticket, so they obey
+# the same resource limits as a coordinator without workers.
+
+async def _extract_job(payload: Dict[str, Any], ticket: Optional[SchedulerTicket] = None) -> str:
+    return await extract_from_url(payload["url"], ticket=ticket)
+
+
+JOB_HANDLERS: Dict[str, Callable[..., Awaitable[Any]]] = {
+    "extract": _extract_job,
+}
+
+
+# --- Coordinator (lives inside the MCP server process) ---
+
+class _Job:
+    __slots__ = ("job_id", "kind", "payload", "future", "ticket", "attempts", "queued", "active")
+
+    def __init__(
+        self,
+        job_id: int,
+        kind: str,
+        payload: Dict[str, Any],
+        future: asyncio.Future,
+        ticket: Optional[SchedulerTicket] = None,
+    ):
+        self.job_id = job_id
+        self.kind = kind
+        self.payload = payload
+        self.future = future
+        self.ticket = ticket
+        self.attempts = 0
+        self.queued = False
+        self.active = 0
+
+
+class _WorkerConn:
+    def __init__(self, name: str, writer: asyncio.StreamWriter, concurrency: int):
+        self.name = name
+        self.writer = writer
+        self.concurrency = concurrency
+        self.leases: Dict[int, asyncio.Future] = {}
+        self.lock = asyncio.Lock()
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        async with self.lock:
+            await _write_message(self.writer, message)
+
+
+class JobCoordinator:
+    """
+    Dispatches fetch+extract jobs to worker processes over TCP.
+
+    Embeddings are not sent to workers: they stay on the coordinator's shared
+    EmbeddingService so Ollama sees one batching client with one concurrency cap.
+
+    Workers pull work: each connected worker gets `concurrency` dispatch slots,
+    and an idle slot takes the next queued job, so fast workers naturally take
+    over work that slow ones have not started. A job whose lease exceeds
+    WORKER_LEASE_TIMEOUT, or whose worker disconnects, is put back on the queue
+    for another worker; the first result to come back wins. A worker that
+    still has not answered WORKER_STALL_TIMEOUT after that is disconnected. With no worker
+    connected, jobs run in-process, including jobs still queued when the last
+    worker goes away. No job waits longer than WORKER_JOB_DEADLINE.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, token: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.token = token or secrets.token_urlsafe(32)
+        self._queue: "asyncio.Queue[_Job]" = asyncio.Queue()
+        self._workers: Dict[str, _WorkerConn] = {}
+        self._jobs: Dict[int, _Job] = {}
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._processes: List[asyncio.subprocess.Process] = []
+        self._local_tasks: Set[asyncio.Task] = set()
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+
+    async def start(self, local_workers: int = 0) -> None:
+        self._server = await asyncio.start_server(self._handle_worker, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        await log("INFO", "workers", f"Coordinator listening on {self.host}:{self.port}")
+        # The MCP server speaks JSON-RPC over stdio: workers must not inherit
+        # its stdin/stdout. The token goes through the environment, not argv.
+        env = {**os.environ, WORKER_TOKEN_ENV: self.token}
+        for _ in range(local_workers):
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "supreme_research_mcp", "worker",
+                "--connect", f"{self.host}:{self.port}", "--no-reconnect",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=sys.stderr,
+                env=env,
+            )
+            self._processes.append(proc)
+        if local_workers:
+            await log("INFO", "workers", f"Spawned {local_workers} local worker processes")
+            await self.wait_for_workers(local_workers, WORKER_CONNECT_TIMEOUT)
+
+    async def wait_for_workers(self, count: int, timeout: float) -> int:
+        """Wait until `count` workers are connected or `timeout` passes; returns how many are."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while len(self._workers) < count and asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.05)
+        if len(self._workers) < count:
+            await log("WARNING", "workers", f"Only {len(self._workers)} of {count} workers connected after {timeout}s")
+        return len(self._workers)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for worker in list(self._workers.values()):
+            worker.writer.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+        for proc in self._processes:
+            if proc.returncode is None:
+                proc.terminate()
+
+    async def submit(self, kind: str, payload: Dict[str, Any], ticket: Optional[SchedulerTicket] = None) -> Any:
+        """
+        Run a job on a worker and return its result.
+
+        Args:
+            kind (str): Key of JOB_HANDLERS.
+            payload (dict): JSON-serializable job arguments.
+            ticket (SchedulerTicket, optional): Scheduler ticket of the submitting
+                request, used when the job ends up running in-process.
+        """
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job = _Job(next(self._ids), kind, payload, asyncio.get_running_loop().create_future(), ticket)
+        self._jobs[job.job_id] = job
+        self._enqueue(job)
+        try:
+            return await asyncio.wait_for(job.future, timeout=WORKER_JOB_DEADLINE)
+        except asyncio.TimeoutError:
+            self.failed += 1
+            raise WorkerJobError(f"{kind} job {job.job_id} timed out after {WORKER_JOB_DEADLINE}s") from None
+        finally:
+            self._jobs.pop(job.job_id, None)
+
+    def _enqueue(self, job: _Job) -> None:
+        if not self._workers:
+            self._run_locally(job)
+            return
+        job.queued = True
+        self._queue.put_nowait(job)
+
+    def _run_locally(self, job: _Job) -> None:
+        async def run() -> None:
+            try:
+                value = await JOB_HANDLERS[job.kind](job.payload, ticket=job.ticket)
+            except Exception as e:
+                if not job.future.done():
+                    self.failed += 1
+                    job.future.set_exception(e)
+                return
+            if not job.future.done():
+                self.completed += 1
+                job.future.set_result(value)
+
+        task = asyncio.create_task(run())
+        self._local_tasks.add(task)
+        task.add_done_callback(self._local_tasks.discard)
+
+    def _drain_locally(self) -> None:
+        """Run every queued job in-process; called once no worker is left to take them."""
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            job.queued = False
+            if not job.future.done():
+                self._run_locally(job)
+
+    def _retry(self, job: _Job, reason: str) -> None:
+        if job.future.done() or job.queued:
+            return
+        job.attempts += 1
+        if job.attempts > WORKER_MAX_RETRIES:
+            self.failed += 1
+            job.future.set_exception(WorkerJobError(f"{job.kind} job gave up after {job.attempts} attempts: {reason}"))
+            return
+        self.retried += 1
+        self._enqueue(job)
+
+    async def _dispatch(self, worker: _WorkerConn) -> None:
+        while True:
+            job = await self._queue.get()
+            job.queued = False
+            if job.future.done():
+                continue
+            lease = asyncio.get_running_loop().create_future()
+            worker.leases[job.job_id] = lease
+            job.active += 1
+            try:
+                try:
+                    await worker.send({"type": "job", "job_id": job.job_id, "kind": job.kind, "payload": job.payload})
+                except ValueError:
+                    # Payload too large for the wire; do it here instead
+                    self._run_locally(job)
+                    continue
+                except (ConnectionError, OSError) as e:
+                    self._retry(job, f"send to {worker.name} failed: {e}")
+                    return
+                try:
+                    await asyncio.wait_for(asyncio.shield(lease), timeout=WORKER_LEASE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    # Let another worker pick the job up; this slot stays busy
+                    # until the stalled worker answers, for a bounded time.
+                    await log("WARNING", "workers", f"Job {job.job_id} stalled on {worker.name}, requeueing")
+                    self._retry(job, f"lease expired on {worker.name}")
+                    try:
+                        await asyncio.wait_for(asyncio.shield(lease), timeout=WORKER_STALL_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        # Socket open but no answer: treat the worker as dead so
+                        # its slots stop swallowing jobs
+                        await log("WARNING", "workers", f"Worker {worker.name} unresponsive, disconnecting")
+                        worker.writer.close()
+                        return
+            finally:
+                job.active -= 1
+                worker.leases.pop(job.job_id, None)
+
+    def _complete(self, message: Dict[str, Any]) -> None:
+        job = self._jobs.get(message.get("job_id"))
+        if job is None or job.future.done():
+            return
+        if message.get("ok"):
+            self.completed += 1
+            job.future.set_result(message.get("value"))
+        else:
+            self.failed += 1
+            job.future.set_exception(WorkerJobError(message.get("error") or "worker error"))
+
+    async def _handle_worker(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        hello = await _read_message(reader)
+        peer = writer.get_extra_info("peername")
+        if not hello or hello.get("type") != "hello":
+            writer.close()
+            return
+        token = hello.get("token")
+        if not isinstance(token, str) or not hmac.compare_digest(token.encode("utf-8"), self.token.encode("utf-8")):
+            await log("WARNING", "workers", f"Rejected worker from {peer}: bad or missing token")
+            writer.close()
+            return
+        name = f"{hello.get('worker', 'worker')}@{peer}"
+        worker = _WorkerConn(name, writer, max(1, int(hello.get("concurrency", WORKER_CONCURRENCY))))
+        self._workers[name] = worker
+        await log("INFO", "workers", f"Worker {name} connected with {worker.concurrency} slots")
+
+        dispatchers = [asyncio.create_task(self._dispatch(worker)) for _ in range(worker.concurrency)]
+        try:
+            while True:
+                message = await _read_message(reader)
+                if message is None:
+                    break
+                if message.get("type") == "result":
+                    lease = worker.leases.get(message.get("job_id"))
+                    if lease is not None and not lease.done():
+                        lease.set_result(None)
+                    self._complete(message)
+        finally:
+            del self._workers[name]
+            for task in dispatchers:
+                task.cancel()
+            for job_id, lease in list(worker.leases.items()):
+                if not lease.done():
+                    lease.set_result(None)
+                job = self._jobs.get(job_id)
+                if job is not None and job.active <= 1:
+                    self._retry(job, f"worker {name} disconnected")
+            await asyncio.gather(*dispatchers, return_exceptions=True)
+            writer.close()
+            await log("WARNING", "workers", f"Worker {name} disconnected")
+            if not self._workers and not self._queue.empty():
+                await log("WARNING", "workers", f"No workers left, running {self._queue.qsize()} queued jobs in-process")
+                self._drain_locally()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "address": f"{self.host}:{self.port}",
+            "workers": {name: {"slots": w.concurrency, "busy": len(w.leases)} for name, w in self._workers.items()},
+            "queued": self._queue.qsize(),
+            "in_flight": len(self._jobs),
+            "completed": self.completed,
+            "failed": self.failed,
+            "retried": self.retried,
+        }
+
+
+_config: Dict[str, Any] = {"listen": None, "local_workers": 0, "token": None}
+_coordinator: Optional[JobCoordinator] = None
+_coordinator_lock: Optional[asyncio.Lock] = None
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def configure_workers(listen: Optional[str] = None, local_workers: int = 0, token: Optional[str] = None) -> None:
+    """
+    Enable coordinator mode for this process. The coordinator starts on the
+    server's event loop through `get_coordinator`: call it before serving so
+    local workers are connected before the first request arrives.
+
+    Args:
+        listen (str, optional): "host:port" for remote workers to connect to.
+            Defaults to an ephemeral port on 127.0.0.1.
+        local_workers (int): Number of worker processes to spawn on this machine.
+        token (str, optional): Shared secret workers must present. Defaults to
+            $SUPREME_RESEARCH_WORKER_TOKEN; required when `listen` is given.
+            Local-only setups get a random token.
+    """
+    token = token or os.environ.get(WORKER_TOKEN_ENV)
+    if listen and not token:
+        raise ValueError(f"A worker token is required with --listen (use --token or ${WORKER_TOKEN_ENV})")
+    _config["listen"] = listen or "127.0.0.1:0"
+    _config["local_workers"] = int(local_workers)
+    _config["token"] = token
+
+
+async def get_coordinator() -> Optional[JobCoordinator]:
+    """Return the running coordinator, or None when worker mode is not configured."""
+    global _coordinator, _coordinator_lock
+    if _config["listen"] is None:
+        return None
+    if _coordinator is not None:
+        return _coordinator
+    if _coordinator_lock is None:
+        _coordinator_lock = asyncio.Lock()
+    async with _coordinator_lock:
+        if _coordinator is None:
+            host, port = parse_address(_config["listen"])
+            coordinator = JobCoordinator(host, port, token=_config["token"])
+            await coordinator.start(_config["local_workers"])
+            _coordinator = coordinator
+    return _coordinator
+
+
+# --- Worker (separate process, possibly on another host) ---
+
+async def _serve_coordinator(host: str, port: int, concurrency: int, token: str) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    lock = asyncio.Lock()
+    tasks: Set[asyncio.Task] = set()
+
+    async def send(message: Dict[str, Any]) -> None:
+        async with lock:
+            await _write_message(writer, message)
+
+    async def run_job(message: Dict[str, Any]) -> None:
+        job_id = message["job_id"]
+        try:
+            value = await JOB_HANDLERS[message["kind"]](message["payload"])
+            await send({"type": "result", "job_id": job_id, "ok": True, "value": value})
+        except (ConnectionError, OSError):
+            raise
+        except Exception as e:
+            await send({"type": "result", "job_id": job_id, "ok": False, "error": f"{type(e).__name__}: {e}"})
+
+    worker_name = f"{socket.gethostname()}:{os.getpid()}"
+    await send({"type": "hello", "worker": worker_name, "concurrency": concurrency, "token": token})
+    await log("INFO", "workers", f"Worker {worker_name} connected to {host}:{port}")
+    try:
+        while True:
+            message = await _read_message(reader)
+            if message is None:
+                break
+            if message.get("type") == "job":
+                task = asyncio.create_task(run_job(message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+    finally:
+        for task in tasks:
+            task.cancel()
+        writer.close()
+
+
+async def run_worker(
+    address: str,
+    concurrency: int = WORKER_CONCURRENCY,
+    reconnect: bool = True,
+    token: Optional[str] = None,
+) -> None:
+    """
+    Connect to a coordinator and execute jobs until the connection closes.
+
+    Args:
+        address (str): Coordinator "host:port".
+        concurrency (int): Jobs this worker runs at once.
+        token (str, optional): Shared secret; defaults to $SUPREME_RESEARCH_WORKER_TOKEN.
+        reconnect (bool): Keep reconnecting after the coordinator goes away.
+            Local workers spawned by the coordinator run with reconnect off so
+            they exit together with the server.
+    """
+    token = token or os.environ.get(WORKER_TOKEN_ENV)
+    if not token:
+        raise ValueError(f"A worker token is required (use --token or ${WORKER_TOKEN_ENV})")
+    host, port = parse_address(address)
+    while True:
+        try:
+            await _serve_coordinator(host, port, concurrency, token)
+        except OSError as e:
+            await log("WARNING", "workers", f"Cannot reach coordinator {address}: {e}")
+        if not reconnect:
+            return
+        await asyncio.sleep(WORKER_RECONNECT_DELAY)
@@ -1,9 +1,19 @@
 # Auto-generated __init__.py
 
 from . import deep_research
+from .deep_research import get_embedding_stats
+from .deep_research import get_negative_cache_stats
+from .deep_research import get_scheduler_stats
+from .deep_research import get_worker_stats
+from .deep_research import profile_requests
 from .deep_research import run_deep_research
 
 __all__ = [
     "deep_research",
+    "get_embedding_stats",
+    "get_negative_cache_stats",
+    "get_scheduler_stats",
+    "get_worker_stats",
+    "profile_requests",
     "run_deep_research",
 ]
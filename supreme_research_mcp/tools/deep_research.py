@@ -1,7 +1,6 @@
 from __future__ import annotations
 import asyncio
 from typing import Dict, Any, List
-from akinus.web.scrape.fetch import fetch_url
 
 # --- imports for search runners ---
 from akinus.web.search.brave import async_brave_search
@@ -15,45 +14,73 @@ from akinus.utils.logger import log
 from supreme_research_mcp.searches.utils import expand_query_ollama
 from supreme_research_mcp.searches.utils import refine_results
 from supreme_research_mcp.searches.utils import print_results
+from supreme_research_mcp.searches.ranking import rank_results
+from supreme_research_mcp.searches.records import SearchResult
 from akinus.web.server.mcp import mcp
 from supreme_research_mcp.searches.extraction import extract_from_url
 from akinus.utils.exceptions import ScrapeError
 from supreme_research_mcp.searches.constants import *
+from supreme_research_mcp.searches.scheduler import SchedulerTicket, SchedulerBusyError, get_scheduler
+from supreme_research_mcp.searches.workers import get_coordinator
+from supreme_research_mcp.searches.embeddings import get_embedding_service
+from supreme_research_mcp.searches.negative_cache import classify_failure, get_negative_cache
+from supreme_research_mcp.searches.profiling import RequestProfile, profile_next_requests, take_profile_request
 
 @mcp.tool()
-async def run_deep_research(query: str, limit: int) -> List[Dict[str, Any]]:
+async def run_deep_research(query: str, limit: int, fetch_budget: int = FETCH_BUDGET, priority: str = "interactive", profile: bool = False) -> List[Dict[str, Any]]:
     """
     Run a deep research query using multiple search engines and databases concurrently.
 
     Parameters:
         query (str): The search query you want to research.
         limit (int): Maximum number of results to fetch per search engine. NO MORE THAN 5!
+        fetch_budget (int): Number of pages to fetch and extract, best-ranked first.
+            Lower-ranked URLs are only fetched to replace failed extractions.
+        priority (str): Scheduling class, "interactive" (default) or "batch".
+            Batch requests only get shared resources nobody interactive is waiting for.
+        profile (bool): Sample CPU stacks and wait times for this request. The
+            flamegraph file goes to data/profiles/ and the result is returned as
+            {"results": ..., "profile": summary}.
 
     Returns:
         List[Dict[str, Any]]: Enriched and refined search results.
     """
     limit = int(limit)
+    fetch_budget = int(fetch_budget)
+    if isinstance(profile, str):
+        profile = profile.strip().lower() in ("1", "true", "yes")
 
+    try:
+        async with get_scheduler().request(priority) as ticket:
+            # Only admitted requests use up a pending `profile_requests` slot
+            if not (profile or take_profile_request()):
+                return await _deep_research(query, limit, fetch_budget, ticket)
+
+            session = RequestProfile(query, request_id=ticket.request_id)
+            session.start()
+            try:
+                results = await _deep_research(query, limit, fetch_budget, ticket)
+            finally:
+                summary = await session.stop(ticket.waits)
+            return {"results": results, "profile": summary}
+    except SchedulerBusyError as e:
+        await log("WARNING", "run_deep_research", f"Request shed for '{query}': {e}")
+        raise
+
+
+async def _deep_research(query: str, limit: int, fetch_budget: int, ticket: SchedulerTicket) -> List[Dict[str, Any]]:
+    """Body of `run_deep_research`, run once the request has been admitted by the scheduler."""
     # Step 1: Expand query
     expanded_queries = await expand_query_ollama(query)
     expanded_queries = expanded_queries[:2]
     expanded_queries.append(query)
     await log("INFO", "run_deep_research", f"Expanded queries: {expanded_queries}")
 
-    all_results: List[Dict[str, Any]] = []
-
-    # Step 2: Concurrency controls
-    semaphores = {
-        "Brave": asyncio.Semaphore(MAX_CONCURRENT_BRAVE),
-        "DuckDuckGo": asyncio.Semaphore(MAX_CONCURRENT_DDG),
-        "OpenAlex": asyncio.Semaphore(MAX_CONCURRENT_OPENALEX),
-        "arXiv": asyncio.Semaphore(MAX_CONCURRENT_ARXIV),
-        "Core": asyncio.Semaphore(MAX_CONCURRENT_CORE),
-        "CrossRef": asyncio.Semaphore(MAX_CONCURRENT_CROSSREF),
-    }
+    all_results: List[SearchResult] = []
 
+    # Step 2: Concurrency controls are server-wide, see searches/scheduler.py
     async def run_source(source_name: str, func, subquery: str):
-        async with semaphores[source_name]:
+        async with ticket.slot(f"search:{source_name}"):
             attempt = 0
             max_retries = (
                 BRAVE_MAX_RETRIES if source_name == "Brave"
@@ -76,10 +103,10 @@ async def run_deep_research(query: str, limit: int) -> List[Dict[str, Any]]:
                         if attempt < max_retries:
                             await asyncio.sleep(retry_delay * attempt)
                             continue
-                    for r in results:
-                        r["source"] = source_name
-                        r["subquery"] = subquery
-                    return results
+                    return [
+                        SearchResult.from_hit(r, source_name, subquery, keep_raw=KEEP_RAW_RESULTS)
+                        for r in results or []
+                    ]
                 except asyncio.TimeoutError:
                     await log("WARNING", "run_deep_research",
                               f"{source_name} timed out for '{subquery}'")
@@ -113,47 +140,163 @@ async def run_deep_research(query: str, limit: int) -> List[Dict[str, Any]]:
     for results in search_results_nested:
         all_results.extend(results)
 
-    # Step 4: Fetch + extract text concurrently with controlled concurrency
-    sem_fetch = asyncio.Semaphore(10)  # adjust for your system/network
+    # Step 4: Rank hits cheaply before fetching anything
+    ranked = rank_results(all_results, expanded_queries)
+    await log("INFO", "run_deep_research",
+              f"Ranked {len(ranked)} unique URLs from {len(all_results)} hits, fetch budget {fetch_budget}")
+    # Duplicate hits were merged into `ranked`; let them go
+    all_results.clear()
+    del search_results_nested
+
+    # Step 5: Fetch + extract text for the top of the ranking within the fetch budget,
+    # on worker processes when running in coordinator mode
+    coordinator = await get_coordinator()
+    negative_cache = get_negative_cache()
 
-    async def enrich_with_text(result: Dict[str, Any]) -> Dict[str, Any]:
-        async with sem_fetch:
-            url = result.get("url")
+    async def enrich_with_text(result: SearchResult) -> SearchResult:
+        async with ticket.slot("fetch"):
+            url = result.url
             if not url:
-                result["text"] = None
-                result["chars"] = 0
+                result.set_text(None)
                 return result
             try:
-                await fetch_url(url)
-                text = await asyncio.wait_for(extract_from_url(url), timeout=15)
-                result["text"] = text
-                result["chars"] = len(text) if text else 0
-            except asyncio.TimeoutError:
-                result["text"] = None
-                result["chars"] = 0
-                result["extraction_error"] = "Timeout after 15 seconds"
+                if coordinator is not None:
+                    text = await coordinator.submit("extract", {"url": url}, ticket=ticket)
+                else:
+                    # extract_from_url downloads the page itself, exactly once
+                    text = await extract_from_url(url, ticket=ticket)
+                result.set_text(text)
             except ScrapeError as e:
-                result["text"] = None
-                result["chars"] = 0
-                result["extraction_error"] = f"ScrapeError: {e}"
+                result.set_error(f"ScrapeError: {e}")
             except Exception as e:
-                result["text"] = None
-                result["chars"] = 0
-                result["extraction_error"] = str(e)
+                result.set_error(str(e))
+
+            if result.chars > 50:
+                negative_cache.record_success(url)
+            else:
+                negative_cache.record_failure(url, classify_failure(result.extraction_error))
             return result
 
-    enriched = await asyncio.gather(*(enrich_with_text(r) for r in all_results))
+    fetched: Dict[int, SearchResult] = {}
+    in_flight: Dict[asyncio.Task, int] = {}
+    succeeded = 0
+    skipped = 0
+    next_index = 0
+    # Fetch the best candidates first, keeping at most (budget - successes)
+    # fetches in flight. As soon as one fails or yields too little text the
+    # next-ranked URL takes its place, without waiting for slower fetches.
+    # URLs and domains in the negative cache are skipped without a fetch.
+    try:
+        while True:
+            while len(in_flight) < fetch_budget - succeeded and next_index < len(ranked):
+                candidate = ranked[next_index]
+                reason = negative_cache.check(candidate.url)
+                if reason:
+                    candidate.set_error(f"Skipped: {reason}")
+                    skipped += 1
+                else:
+                    in_flight[asyncio.create_task(enrich_with_text(candidate))] = next_index
+                next_index += 1
+            if not in_flight:
+                break
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                fetched[in_flight.pop(task)] = result
+                if result.chars > 50:
+                    succeeded += 1
+    finally:
+        for task in in_flight:
+            task.cancel()
+    # Back to rank order, whatever order the fetches finished in
+    enriched = [fetched[i] for i in sorted(fetched)]
+    del fetched
+
+    await log("INFO", "run_deep_research",
+              f"Fetched {len(enriched)} of {len(ranked)} ranked URLs, {succeeded} usable, "
+              f"{skipped} skipped by negative cache")
+    del ranked
 
-    # Step 5: Filter low-quality
-    filtered_results = [r for r in enriched if r.get("text") and len(r["text"]) > 50]
+    # Step 6: Filter low-quality
+    filtered_results = [r for r in enriched if r.chars > 50]
+    del enriched
 
-    # Step 6: Preview
+    # Step 7: Preview
     print_results(filtered_results)
 
-    # Step 7: Refine with embeddings
+    # Step 8: Refine with embeddings
     refined_results = await refine_results(filtered_results, query, top_k=10, chunk_size=500, overlap=250)
 
     await log("INFO", "run_deep_research",
               f"Successfully refined top results. Total entries: {len(refined_results)}")
     return refined_results
 
+
+
+@mcp.tool()
+async def get_scheduler_stats() -> Dict[str, Any]:
+    """
+    Report server-wide scheduler state: running and queued requests, shed count,
+    and in-use / waiting slots for every shared resource.
+
+    Returns:
+        Dict[str, Any]: Scheduler statistics.
+    """
+    return get_scheduler().stats()
+
+
+@mcp.tool()
+async def profile_requests(count: int) -> Dict[str, Any]:
+    """
+    Admin: profile the next `count` run_deep_research calls as if they were
+    made with profile=True. Pass 0 to cancel pending profiles.
+
+    Parameters:
+        count (int): Number of upcoming requests to profile.
+
+    Returns:
+        Dict[str, Any]: Number of requests that will be profiled.
+    """
+    pending = profile_next_requests(int(count))
+    await log("INFO", "profile_requests", f"Profiling the next {pending} requests")
+    return {"pending": pending}
+
+
+@mcp.tool()
+async def get_embedding_stats() -> Dict[str, Any]:
+    """
+    Report batching metrics of the shared Ollama embedding client: request and
+    batch counts, average / max batch size, queue wait and batch latency.
+
+    Returns:
+        Dict[str, Any]: Embedding service statistics.
+    """
+    return get_embedding_service().stats()
+
+
+@mcp.tool()
+async def get_negative_cache_stats() -> Dict[str, Any]:
+    """
+    Report URLs and domains that recently failed to fetch or extract: per-domain
+    successes, failures by type, current failure streak, skipped fetches and
+    remaining backoff.
+
+    Returns:
+        Dict[str, Any]: Negative cache statistics.
+    """
+    return get_negative_cache().stats()
+
+
+@mcp.tool()
+async def get_worker_stats() -> Dict[str, Any]:
+    """
+    Report coordinator/worker state: connected workers and their busy slots,
+    queued and in-flight jobs, and completed / failed / retried counts.
+
+    Returns:
+        Dict[str, Any]: Worker statistics, or {"enabled": False} outside coordinator mode.
+    """
+    coordinator = await get_coordinator()
+    if coordinator is None:
+        return {"enabled": False}
+    return {"enabled": True, **coordinator.stats()}
@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+
+from supreme_research_mcp.searches import extraction
+from supreme_research_mcp.searches.scheduler import ResearchScheduler
+
+PAGE = "<html><body><main><article>" + "<p>Findings of the survey.</p>" * 20 + "</article></main></body></html>"
+
+
+def _slow_extractor(doc):
+    time.sleep(0.1)
+    return "Findings of the survey. " * 10
+
+
+def _patch_extractors(monkeypatch, extractor):
+    async def fetch(url):
+        return PAGE
+
+    monkeypatch.setattr(extraction, "_fetch_html", fetch)
+    for name in ("beautiful_soup_extract", "readability_extract", "trafilatura_extract"):
+        monkeypatch.setattr(extraction, name, extractor)
+    monkeypatch.setattr(extraction, "_newspaper_from_html", lambda url, html: "")
+
+
+def test_waiting_for_extract_slot_does_not_count_as_fetch_timeout(monkeypatch):
+    monkeypatch.setattr(extraction, "FETCH_TIMEOUT", 0.2)
+    _patch_extractors(monkeypatch, _slow_extractor)
+
+    async def scenario():
+        # One extract slot for six pages: most of them queue far past FETCH_TIMEOUT
+        scheduler = ResearchScheduler(limits={"extract": 1})
+        async with scheduler.request() as ticket:
+            texts = await asyncio.gather(
+                *(extraction.extract_from_url(f"https://example.org/{i}", ticket=ticket) for i in range(6))
+            )
+            return texts, ticket.waits["extract"]
+
+    texts, waits = asyncio.run(scenario())
+    assert all("Findings" in t for t in texts)
+    assert waits["max_s"] > 0.2
+
+
+def test_cancelled_extraction_holds_its_slot_until_threads_finish(monkeypatch):
+    def stuck_extractor(doc):
+        time.sleep(0.3)
+        return "late"
+
+    _patch_extractors(monkeypatch, stuck_extractor)
+
+    async def scenario():
+        scheduler = ResearchScheduler(limits={"extract": 1})
+        slot = scheduler.resource("extract")
+        async with scheduler.request() as ticket:
+            task = asyncio.create_task(extraction.extract_from_url("https://example.org", ticket=ticket))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            in_use_after_cancel = slot.in_use
+            await asyncio.sleep(0.4)
+            return in_use_after_cancel, slot.in_use
+
+    assert asyncio.run(scenario()) == (1, 0)
@@ -0,0 +1,55 @@
+from supreme_research_mcp.searches.constants import NEGATIVE_CACHE_DOMAIN_THRESHOLD, NEGATIVE_CACHE_TTLS
+from supreme_research_mcp.searches.negative_cache import NegativeCache, classify_failure
+
+
+def test_empty_timeout_message_is_classified_as_timeout():
+    assert classify_failure("ScrapeError: Extraction failed for URL https://a.org/x: TimeoutError") == "timeout"
+    assert classify_failure("ScrapeError: Failed to fetch HTML: status 403") == "blocked"
+
+
+def test_domain_backs_off_after_consecutive_failures():
+    cache = NegativeCache()
+    for i in range(NEGATIVE_CACHE_DOMAIN_THRESHOLD):
+        cache.record_failure(f"https://www.example.org/{i}", "server_error")
+    assert cache.check("https://example.org/other") is not None
+
+    cache.record_success("https://example.org/ok")
+    assert cache.check("https://example.org/other") is None
+
+
+def test_redirector_failures_do_not_back_off_the_domain():
+    cache = NegativeCache()
+    for i in range(NEGATIVE_CACHE_DOMAIN_THRESHOLD + 2):
+        cache.record_failure(f"https://doi.org/10.1000/{i}", "blocked")
+    assert cache.check("https://doi.org/10.1000/0") is not None
+    assert cache.check("https://doi.org/10.1000/new") is None
+    assert "doi.org" not in cache.stats()["domains"]
+
+
+def test_domain_table_is_bounded():
+    cache = NegativeCache(max_domains=3)
+    for i in range(10):
+        cache.record_failure(f"https://site{i}.org/", "error")
+    assert set(cache.stats()["domains"]) == {"site7.org", "site8.org", "site9.org"}
+
+
+def test_domain_backoff_starts_at_base_ttl_when_threshold_is_reached():
+    cache = NegativeCache()
+    for i in range(NEGATIVE_CACHE_DOMAIN_THRESHOLD):
+        cache.record_failure(f"https://example.org/{i}", "blocked")
+    backoff = cache.stats()["domains"]["example.org"]["backed_off_for_s"]
+    assert NEGATIVE_CACHE_TTLS["blocked"] - 5 <= backoff <= NEGATIVE_CACHE_TTLS["blocked"]
+
+    cache.record_failure("https://example.org/next", "blocked")
+    backoff = cache.stats()["domains"]["example.org"]["backed_off_for_s"]
+    assert backoff > NEGATIVE_CACHE_TTLS["blocked"] * 2 - 5
+
+
+def test_dead_links_do_not_back_off_the_domain():
+    cache = NegativeCache()
+    for i in range(NEGATIVE_CACHE_DOMAIN_THRESHOLD + 2):
+        cache.record_failure(f"https://publisher.org/stale/{i}", "not_found")
+        cache.record_failure(f"https://publisher.org/blank/{i}", "empty")
+    assert cache.check("https://publisher.org/stale/0") is not None
+    assert cache.check("https://publisher.org/fresh") is None
+    assert cache.stats()["domains"]["publisher.org"]["failures"] == 2 * (NEGATIVE_CACHE_DOMAIN_THRESHOLD + 2)
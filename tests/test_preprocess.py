@@ -0,0 +1,30 @@
+from supreme_research_mcp.searches.preprocess import clean_html
+
+ARTICLE = "<p>Measured results of the study are reported below.</p>" * 20
+
+
+def test_page_wrapped_in_a_form_keeps_its_content():
+    # ASP.NET WebForms pages put the whole body inside <form runat="server">
+    page = (
+        '<html><body><form id="form1"><input type="hidden" name="__VIEWSTATE" value="dDwtMTIz"/>'
+        f'<div class="content"><h1>Title</h1>{ARTICLE}</div><nav>Home | About</nav></form></body></html>'
+    )
+    cleaned = clean_html(page)
+    assert "Measured results" in cleaned
+    assert "__VIEWSTATE" not in cleaned
+    assert "Home | About" not in cleaned
+
+
+def test_small_forms_are_removed():
+    page = f"<html><body>{ARTICLE}<form><label>Subscribe to our newsletter</label><input name='email'/></form></body></html>"
+    cleaned = clean_html(page)
+    assert "Measured results" in cleaned
+    assert "newsletter" not in cleaned
+
+
+def test_boilerplate_is_removed_but_tail_text_kept():
+    page = "<html><body><script>var x = 1;</script>kept tail<main><article><header><h1>Headline</h1></header></article></main></body></html>"
+    cleaned = clean_html(page)
+    assert "var x" not in cleaned
+    assert "kept tail" in cleaned
+    assert "Headline" in cleaned
@@ -0,0 +1,31 @@
+import threading
+import time
+
+from supreme_research_mcp.searches.profiling import SamplingProfiler
+
+
+def _spin(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sampler_attributes_samples_to_the_busy_function(tmp_path):
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin, args=(stop,), name="spinner")
+    profiler = SamplingProfiler(interval=0.005)
+    worker.start()
+    profiler.start()
+    time.sleep(0.2)
+    profiler.stop()
+    stop.set()
+    worker.join()
+
+    assert profiler.samples > 0
+    assert any(stack.startswith("spinner;") and stack.split(";")[-1].startswith("_spin (test_profiling.py:") for stack in profiler.stacks)
+    assert profiler.top_functions()[0]["function"].startswith("_spin ")
+
+    path = tmp_path / "profile.folded"
+    profiler.write_folded(path)
+    line = path.read_text(encoding="utf-8").splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert ";" in stack and int(count) > 0
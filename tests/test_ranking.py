@@ -0,0 +1,26 @@
+from supreme_research_mcp.searches.ranking import _normalize_url, rank_results
+from supreme_research_mcp.searches.records import SearchResult
+
+
+def test_only_scheme_and_host_are_case_insensitive():
+    assert _normalize_url("HTTPS://WWW.Example.org/Paper/") == _normalize_url("http://example.org/Paper")
+    assert _normalize_url("https://example.org/Paper") != _normalize_url("https://example.org/paper")
+    assert _normalize_url("https://example.org/view?id=AbC") != _normalize_url("https://example.org/view?id=abc")
+
+
+def test_duplicates_keep_the_richest_hit():
+    bare = SearchResult("https://example.org/polar-bears", source="DuckDuckGo")
+    rich = SearchResult(
+        "https://www.example.org/polar-bears/",
+        title="Polar bear populations and sea ice",
+        source="OpenAlex",
+        snippet="Climate change reduces sea ice available to polar bears.",
+    )
+    other = SearchResult("https://example.org/Polar-Bears", title="Unrelated", source="Brave")
+
+    ranked = rank_results([bare, rich, other], ["polar bear populations"])
+
+    assert len(ranked) == 2
+    top = ranked[0]
+    assert top is rich
+    assert top.duplicates == 2
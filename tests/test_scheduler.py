@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from supreme_research_mcp.searches.scheduler import ResearchScheduler, SchedulerBusyError
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _job(ticket, label, order, hold=0.0):
+    async with ticket.slot("cpu"):
+        order.append(label)
+        await asyncio.sleep(hold)
+
+
+def test_requests_take_turns_on_a_shared_resource():
+    async def scenario():
+        scheduler = ResearchScheduler(limits={"cpu": 1})
+        order = []
+        async with scheduler.request() as a, scheduler.request() as b:
+            blocker = asyncio.create_task(_job(a, "blocker", order, hold=0.01))
+            await _settle()
+            jobs = [asyncio.create_task(_job(a, f"a{i}", order)) for i in range(3)]
+            jobs += [asyncio.create_task(_job(b, f"b{i}", order)) for i in range(3)]
+            await asyncio.gather(blocker, *jobs)
+        return order
+
+    assert asyncio.run(scenario()) == ["blocker", "a0", "b0", "a1", "b1", "a2", "b2"]
+
+
+def test_interactive_requests_are_served_before_batch():
+    async def scenario():
+        scheduler = ResearchScheduler(limits={"cpu": 1})
+        order = []
+        async with scheduler.request("batch") as batch, scheduler.request("interactive") as interactive:
+            blocker = asyncio.create_task(_job(batch, "blocker", order, hold=0.01))
+            await _settle()
+            jobs = [asyncio.create_task(_job(batch, f"batch{i}", order)) for i in range(2)]
+            await _settle()
+            jobs += [asyncio.create_task(_job(interactive, f"interactive{i}", order)) for i in range(2)]
+            await asyncio.gather(blocker, *jobs)
+        return order
+
+    assert asyncio.run(scenario()) == ["blocker", "interactive0", "interactive1", "batch0", "batch1"]
+
+
+def test_requests_beyond_the_queue_are_shed():
+    async def scenario():
+        scheduler = ResearchScheduler(limits={}, max_active=1, max_queued=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with scheduler.request():
+                await release.wait()
+
+        running = asyncio.create_task(hold())
+        await _settle()
+        queued = asyncio.create_task(hold())
+        await _settle()
+        with pytest.raises(SchedulerBusyError):
+            async with scheduler.request():
+                pass
+        release.set()
+        await asyncio.gather(running, queued)
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["shed"] == 1
+    assert stats["admission"] == {"capacity": 1, "in_use": 0, "waiting": 0}
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    async def scenario():
+        scheduler = ResearchScheduler(limits={"cpu": 1})
+        order = []
+        async with scheduler.request() as ticket:
+            blocker = asyncio.create_task(_job(ticket, "blocker", order, hold=0.01))
+            await _settle()
+            cancelled = asyncio.create_task(_job(ticket, "cancelled", order))
+            waiting = asyncio.create_task(_job(ticket, "waiting", order))
+            await _settle()
+            cancelled.cancel()
+            await asyncio.gather(blocker, waiting)
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+        return order, scheduler.resource("cpu").stats()
+
+    order, stats = asyncio.run(scenario())
+    assert order == ["blocker", "waiting"]
+    assert stats == {"capacity": 1, "in_use": 0, "waiting": 0}
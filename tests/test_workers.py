@@ -0,0 +1,144 @@
+import asyncio
+
+from supreme_research_mcp.searches import workers
+
+TOKEN = "test-token"
+
+
+async def _local_extract(payload, ticket=None):
+    return {"url": payload["url"], "ran": "local"}
+
+
+async def _connect(coordinator, token=TOKEN):
+    reader, writer = await asyncio.open_connection("127.0.0.1", coordinator.port)
+    await workers._write_message(writer, {"type": "hello", "worker": "fake", "concurrency": 1, "token": token})
+    await asyncio.sleep(0.1)
+    return reader, writer
+
+
+def test_job_runs_locally_when_last_worker_disconnects(monkeypatch):
+    monkeypatch.setitem(workers.JOB_HANDLERS, "extract", _local_extract)
+
+    async def scenario():
+        coordinator = workers.JobCoordinator(token=TOKEN)
+        await coordinator.start()
+        try:
+            reader, writer = await _connect(coordinator)
+            assert len(coordinator.stats()["workers"]) == 1
+
+            task = asyncio.create_task(coordinator.submit("extract", {"url": "https://example.org"}))
+            job = await workers._read_message(reader)
+            assert job["type"] == "job" and job["kind"] == "extract"
+
+            # Drop the connection without answering
+            writer.close()
+            result = await asyncio.wait_for(task, 5)
+            return result, coordinator.stats()
+        finally:
+            await coordinator.close()
+
+    result, stats = asyncio.run(scenario())
+    assert result == {"url": "https://example.org", "ran": "local"}
+    assert stats["workers"] == {}
+    assert stats["retried"] == 1
+    assert stats["completed"] == 1
+
+
+def test_stalled_job_is_leased_to_another_worker(monkeypatch):
+    monkeypatch.setattr(workers, "WORKER_LEASE_TIMEOUT", 0.2)
+
+    async def scenario():
+        coordinator = workers.JobCoordinator(token=TOKEN)
+        await coordinator.start()
+        try:
+            stalled_reader, stalled_writer = await _connect(coordinator)
+            task = asyncio.create_task(coordinator.submit("extract", {"url": "https://example.org"}))
+            job = await workers._read_message(stalled_reader)
+
+            # A second worker picks the job up once the first lease expires
+            reader, writer = await _connect(coordinator)
+            retried = await asyncio.wait_for(workers._read_message(reader), 5)
+            assert retried["job_id"] == job["job_id"]
+            await workers._write_message(writer, {"type": "result", "job_id": job["job_id"], "ok": True, "value": "remote"})
+            result = await asyncio.wait_for(task, 5)
+            stalled_writer.close()
+            writer.close()
+            return result
+        finally:
+            await coordinator.close()
+
+    assert asyncio.run(scenario()) == "remote"
+
+
+def test_worker_with_bad_token_is_rejected():
+    async def scenario():
+        coordinator = workers.JobCoordinator(token=TOKEN)
+        await coordinator.start()
+        try:
+            reader, writer = await _connect(coordinator, token="wrong")
+            closed = await asyncio.wait_for(workers._read_message(reader), 5)
+            writer.close()
+            return closed, coordinator.stats()
+        finally:
+            await coordinator.close()
+
+    closed, stats = asyncio.run(scenario())
+    assert closed is None
+    assert stats["workers"] == {}
+
+
+def test_oversized_frame_is_rejected():
+    async def scenario():
+        reader = asyncio.StreamReader()
+        reader.feed_data(workers._HEADER.pack(workers.WORKER_MAX_FRAME + 1))
+        reader.feed_eof()
+        return await workers._read_message(reader)
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_unresponsive_worker_is_disconnected(monkeypatch):
+    monkeypatch.setattr(workers, "WORKER_LEASE_TIMEOUT", 0.1)
+    monkeypatch.setattr(workers, "WORKER_STALL_TIMEOUT", 0.2)
+    monkeypatch.setitem(workers.JOB_HANDLERS, "extract", _local_extract)
+
+    async def scenario():
+        coordinator = workers.JobCoordinator(token=TOKEN)
+        await coordinator.start()
+        try:
+            # Connected and reading, but never answers
+            reader, writer = await _connect(coordinator)
+            result = await asyncio.wait_for(coordinator.submit("extract", {"url": "https://example.org"}), 5)
+            writer.close()
+            return result, coordinator.stats()
+        finally:
+            await coordinator.close()
+
+    result, stats = asyncio.run(scenario())
+    assert result["ran"] == "local"
+    assert stats["workers"] == {}
+
+
+def test_jobs_without_workers_use_the_ticket_and_count_in_stats(monkeypatch):
+    seen = []
+
+    async def extract(payload, ticket=None):
+        seen.append(ticket)
+        return "text"
+
+    monkeypatch.setitem(workers.JOB_HANDLERS, "extract", extract)
+
+    async def scenario():
+        coordinator = workers.JobCoordinator(token=TOKEN)
+        await coordinator.start()
+        ticket = object()
+        try:
+            result = await coordinator.submit("extract", {"url": "https://example.org"}, ticket=ticket)
+            return result, ticket, coordinator.stats()
+        finally:
+            await coordinator.close()
+
+    result, ticket, stats = asyncio.run(scenario())
+    assert result == "text"
+    assert seen == [ticket]
+    assert stats["completed"] == 1